@@ -24,8 +24,13 @@ from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.compliance import display_compliance_table
-from prowler.lib.outputs.html import add_html_footer, fill_html_overview_statistics
+from prowler.lib.outputs.compliance import display_compliance_tables
+from prowler.lib.outputs.html import (
+    add_html_compact_footer,
+    add_html_footer,
+    fill_html_overview_statistics,
+    get_html_compact_page_name,
+)
 from prowler.lib.outputs.json import close_json
 from prowler.lib.outputs.outputs import extract_findings_statistics, send_to_s3_bucket
 from prowler.lib.outputs.summary_table import display_summary_table
@@ -34,6 +39,9 @@ from prowler.providers.aws.lib.quick_inventory.quick_inventory import quick_inve
 from prowler.providers.aws.lib.security_hub.security_hub import (
     resolve_security_hub_previous_findings,
 )
+from prowler.providers.aws.services.iam.iam_service import (
+    start_credential_report_generation,
+)
 from prowler.providers.common.audit_info import set_provider_audit_info
 from prowler.providers.common.outputs import set_provider_output_options
 
@@ -160,6 +168,12 @@ def prowler():
         quick_inventory(audit_info, args.output_directory)
         sys.exit()
 
+    # Start the IAM credential report generation before the checks need it
+    if provider == "aws" and any(
+        check.startswith("iam_") for check in checks_to_execute
+    ):
+        start_credential_report_generation(audit_info)
+
     # Execute checks
     findings = []
     if len(checks_to_execute):
@@ -188,6 +202,18 @@ def prowler():
                 fill_html_overview_statistics(
                     stats, audit_output_options.output_filename, args.output_directory
                 )
+            output_filenames = [audit_output_options.output_filename]
+            if mode == "html-compact":
+                add_html_compact_footer(audit_output_options.html_compact_report)
+                # The compact HTML report could be split into several pages
+                output_filenames = [
+                    get_html_compact_page_name(
+                        audit_output_options.output_filename, page
+                    )
+                    for page in range(
+                        1, audit_output_options.html_compact_report.page + 1
+                    )
+                ]
             # Send output to S3 if needed (-B / -D)
             if provider == "aws" and (
                 args.output_bucket or args.output_bucket_no_assume
@@ -198,17 +224,27 @@ def prowler():
                 if args.output_bucket_no_assume:
                     output_bucket = args.output_bucket_no_assume
                     bucket_session = audit_info.original_session
-                send_to_s3_bucket(
-                    audit_output_options.output_filename,
-                    args.output_directory,
-                    mode,
-                    output_bucket,
-                    bucket_session,
-                )
+                for output_filename in output_filenames:
+                    send_to_s3_bucket(
+                        output_filename,
+                        args.output_directory,
+                        mode,
+                        output_bucket,
+                        bucket_session,
+                    )
 
     # Resolve previous fails of Security Hub
     if provider == "aws" and args.security_hub and not args.skip_sh_update:
-        resolve_security_hub_previous_findings(args.output_directory, audit_info)
+        resolve_security_hub_previous_findings(
+            audit_output_options.security_hub_findings_ids, audit_info
+        )
+        # Archived findings are removed from the local state
+        if audit_output_options.security_hub_state:
+            audit_output_options.security_hub_state.purge(
+                list(audit_output_options.security_hub_findings_ids.keys())
+            )
+    if provider == "aws" and audit_output_options.security_hub_state:
+        audit_output_options.security_hub_state.close()
 
     # Display summary table
     if not args.only_logs:
@@ -220,15 +256,14 @@ def prowler():
         )
 
         if compliance_framework and findings:
-            for compliance in compliance_framework:
-                # Display compliance table
-                display_compliance_table(
-                    findings,
-                    bulk_checks_metadata,
-                    compliance,
-                    audit_output_options.output_filename,
-                    audit_output_options.output_directory,
-                )
+            # Display compliance tables, aggregated in a single pass over the findings
+            display_compliance_tables(
+                findings,
+                bulk_checks_metadata,
+                compliance_framework,
+                audit_output_options.output_filename,
+                audit_output_options.output_directory,
+            )
 
     # If there are failed findings exit code 3, except if -z is input
     if not args.ignore_exit_code_3 and stats["total_fail"] > 0:
@@ -29,6 +29,20 @@ with os.scandir(compliance_aws_dir) as files:
         and available_compliance_frameworks.append(file.name.removesuffix(".json"))
     ]
 
+# Security Hub regions reconciled at the same time
+security_hub_max_concurrent_regions = 8
+
+# IAM credential report polling backoff, in seconds
+credential_report_initial_backoff = 0.25
+credential_report_max_backoff = 8
+credential_report_max_wait = 300
+
+# API calls run at the same time by the declarative AWS services
+aws_service_max_workers = 32
+
+# Seconds the enabled regions of an account are cached
+enabled_regions_cache_ttl = 3600
+
 # AWS services-regions matrix json
 aws_services_json_file = "aws_regions_by_service.json"
 
@@ -40,6 +54,9 @@ csv_file_suffix = ".csv"
 json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 html_file_suffix = ".html"
+html_compact_file_suffix = ".compact.html"
+# Findings per page of the compact HTML report, bigger reports are split into pages
+html_compact_max_findings_per_page = 100000
 config_yaml = f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 
 
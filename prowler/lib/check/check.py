@@ -1,6 +1,8 @@
 import functools
 import importlib
+import importlib.util
 import os
+import re
 import sys
 import traceback
 from pkgutil import walk_packages
@@ -333,6 +335,60 @@ def run_check(check: Check, output_options: Provider_Output_Options) -> list:
         return findings
 
 
+# Service clients imported by a check module
+service_client_import = re.compile(
+    r"from\s+(prowler\.providers\.\w+\.services\.\w+\.\w+_client)\s+import"
+)
+
+
+def get_check_service_clients(check_name: str, provider: str) -> set:
+    """get_check_service_clients returns the service client modules imported by the check, reading its source without importing it"""
+    try:
+        service = check_name.split("_")[0]
+        check_spec = importlib.util.find_spec(
+            f"prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        )
+        with open(check_spec.origin) as check_file:
+            return set(service_client_import.findall(check_file.read()))
+    except Exception as error:
+        logger.debug(
+            f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return set()
+
+
+def get_execution_plan(checks_to_execute: list, provider: str) -> dict:
+    """get_execution_plan returns the checks grouped by service, each one with the service clients that are not used after it"""
+    services_checks = {}
+    for check_name in checks_to_execute:
+        services_checks.setdefault(check_name.split("_")[0], []).append(check_name)
+    execution_plan = {
+        check_name: [] for checks in services_checks.values() for check_name in checks
+    }
+    # The last check using each service client releases it
+    last_checks = {}
+    for check_name in execution_plan:
+        for service_client in sorted(get_check_service_clients(check_name, provider)):
+            last_checks[service_client] = check_name
+    for service_client, check_name in last_checks.items():
+        execution_plan[check_name].append(service_client)
+    return execution_plan
+
+
+def release_service_client(service_client: str):
+    """release_service_client frees the data of the service client, importing it again would create a new one"""
+    try:
+        client_module = sys.modules.pop(service_client, None)
+        if client_module:
+            client = getattr(client_module, service_client.rsplit(".", 1)[1], None)
+            if client is not None and hasattr(client, "__dict__"):
+                vars(client).clear()
+    except Exception as error:
+        logger.error(
+            f"{service_client} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
 def execute_checks(
     checks_to_execute: list,
     provider: str,
@@ -353,9 +409,12 @@ def execute_checks(
         audit_progress=0,
     )
 
+    # Service clients are released after their last check to bound the memory usage
+    execution_plan = get_execution_plan(checks_to_execute, provider)
+
     # Execution with the --only-logs flag
     if audit_output_options.only_logs:
-        for check_name in checks_to_execute:
+        for check_name, service_clients in execution_plan.items():
             # Recover service from check name
             service = check_name.split("_")[0]
             try:
@@ -369,6 +428,8 @@ def execute_checks(
                     checks_executed,
                 )
                 all_findings.extend(check_findings)
+                for service_client in service_clients:
+                    release_service_client(service_client)
 
             # If check does not exists in the provider or is from another provider
             except ModuleNotFoundError:
@@ -398,7 +459,7 @@ def execute_checks(
             stats=False,
             enrich_print=False,
         ) as bar:
-            for check_name in checks_to_execute:
+            for check_name, service_clients in execution_plan.items():
                 # Recover service from check name
                 service = check_name.split("_")[0]
                 bar.title = (
@@ -415,6 +476,8 @@ def execute_checks(
                         checks_executed,
                     )
                     all_findings.extend(check_findings)
+                    for service_client in service_clients:
+                        release_service_client(service_client)
                     bar()
 
                 # If check does not exists in the provider or is from another provider
@@ -121,7 +121,7 @@ Detailed documentation at https://docs.prowler.cloud
             nargs="+",
             help="Output modes, by default csv, html and json",
             default=["csv", "json", "html"],
-            choices=["csv", "json", "json-asff", "html"],
+            choices=["csv", "json", "json-asff", "html", "html-compact"],
         )
         common_outputs_parser.add_argument(
             "-F",
@@ -321,6 +321,19 @@ Detailed documentation at https://docs.prowler.cloud
             action="store_true",
             help="Skip updating previous findings of Prowler in Security Hub",
         )
+        aws_security_hub_subparser.add_argument(
+            "--sh-state-file",
+            nargs="?",
+            default=None,
+            help="SQLite file to keep the findings sent to Security Hub, so only new, changed or resolved findings are sent in the next executions",
+        )
+        aws_security_hub_subparser.add_argument(
+            "--sh-refresh-days",
+            nargs="?",
+            default=30,
+            type=int,
+            help="Days after which unchanged findings are sent again to Security Hub to refresh them when using --sh-state-file (Default: 30)",
+        )
         # AWS Quick Inventory
         aws_quick_inventory_subparser = aws_parser.add_argument_group("Quick Inventory")
         aws_quick_inventory_subparser.add_argument(
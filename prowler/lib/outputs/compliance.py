@@ -159,16 +159,193 @@ def fill_compliance(output_options, finding, audit_info, file_descriptors):
         )
 
 
+def get_compliance_table_type(compliance_framework: str) -> str:
+    """get_compliance_table_type returns the kind of summary table rendered for the given compliance framework, or None if it has no table"""
+    if compliance_framework == "ens_rd2022_aws":
+        return "ens"
+    elif "cis_1." in compliance_framework:
+        return "cis"
+    return None
+
+
+def __compliance_table_matches__(compliance, compliance_framework: str) -> bool:
+    """__compliance_table_matches__ returns True if the check's compliance belongs to the given compliance framework table"""
+    table_type = get_compliance_table_type(compliance_framework)
+    if table_type == "ens":
+        return (
+            compliance.Framework == "ENS"
+            and compliance.Provider == "AWS"
+            and compliance.Version == "RD2022"
+        )
+    elif table_type == "cis":
+        return (
+            compliance.Framework == "CIS" and compliance.Version in compliance_framework
+        )
+    return False
+
+
+def build_compliance_tables_index(
+    bulk_checks_metadata: dict, compliance_frameworks: list
+) -> dict:
+    """
+    build_compliance_tables_index returns an index from CheckID to the requirement attributes it touches for the given compliance frameworks tables:
+    {
+        "CheckID": [(compliance_framework, compliance, attribute), ...]
+    }
+    """
+    compliance_tables_index = {}
+    table_frameworks = [
+        compliance_framework
+        for compliance_framework in compliance_frameworks
+        if get_compliance_table_type(compliance_framework)
+    ]
+    if not table_frameworks:
+        return compliance_tables_index
+    for check_id, check_metadata in bulk_checks_metadata.items():
+        check_compliances = getattr(check_metadata, "Compliance", None) or []
+        for compliance in check_compliances:
+            for compliance_framework in table_frameworks:
+                if __compliance_table_matches__(compliance, compliance_framework):
+                    for requirement in compliance.Requirements:
+                        for attribute in requirement.Attributes:
+                            compliance_tables_index.setdefault(check_id, []).append(
+                                (compliance_framework, compliance, attribute)
+                            )
+    return compliance_tables_index
+
+
+def aggregate_compliance_tables(
+    findings: list, bulk_checks_metadata: dict, compliance_frameworks: list
+) -> dict:
+    """
+    aggregate_compliance_tables builds the summary tables of every given compliance framework in a single pass over the findings and returns:
+    {
+        "compliance_framework": {
+            "framework": "CIS",
+            "version": "1.4",
+            "provider": "AWS",
+            "pass_count": 0,
+            "fail_count": 0,
+            "groups": {},
+        }
+    }
+    The groups are the ENS Marco/Categoria or the CIS Sections with their counters.
+    """
+    compliance_tables = {}
+    for compliance_framework in compliance_frameworks:
+        if get_compliance_table_type(compliance_framework):
+            compliance_tables[compliance_framework] = {
+                "framework": "",
+                "version": "",
+                "provider": "",
+                "pass_count": 0,
+                "fail_count": 0,
+                "groups": {},
+            }
+    if not compliance_tables:
+        return compliance_tables
+
+    compliance_tables_index = build_compliance_tables_index(
+        bulk_checks_metadata, list(compliance_tables.keys())
+    )
+    for finding in findings:
+        for compliance_framework, compliance, attribute in compliance_tables_index.get(
+            finding.check_metadata.CheckID, []
+        ):
+            compliance_table = compliance_tables[compliance_framework]
+            compliance_table["framework"] = compliance.Framework
+            compliance_table["version"] = compliance.Version
+            compliance_table["provider"] = compliance.Provider
+            if finding.status == "FAIL":
+                compliance_table["fail_count"] += 1
+            elif finding.status == "PASS":
+                compliance_table["pass_count"] += 1
+
+            groups = compliance_table["groups"]
+            if get_compliance_table_type(compliance_framework) == "ens":
+                marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                # Check if Marco/Categoria exists
+                if marco_categoria not in groups:
+                    groups[marco_categoria] = {
+                        "Estado": "CUMPLE",
+                        "Opcional": 0,
+                        "Alto": 0,
+                        "Medio": 0,
+                        "Bajo": 0,
+                    }
+                if finding.status == "FAIL":
+                    groups[marco_categoria]["Estado"] = "NO CUMPLE"
+                if attribute.Nivel == "opcional":
+                    groups[marco_categoria]["Opcional"] += 1
+                elif attribute.Nivel == "alto":
+                    groups[marco_categoria]["Alto"] += 1
+                elif attribute.Nivel == "medio":
+                    groups[marco_categoria]["Medio"] += 1
+                elif attribute.Nivel == "bajo":
+                    groups[marco_categoria]["Bajo"] += 1
+            else:
+                section = attribute.Section
+                # Check if Section exists
+                if section not in groups:
+                    groups[section] = {
+                        "Level 1": {"FAIL": 0, "PASS": 0},
+                        "Level 2": {"FAIL": 0, "PASS": 0},
+                    }
+                if attribute.Profile in ("Level 1", "Level 2"):
+                    if finding.status == "FAIL":
+                        groups[section][attribute.Profile]["FAIL"] += 1
+                    else:
+                        groups[section][attribute.Profile]["PASS"] += 1
+
+    return compliance_tables
+
+
+def display_compliance_tables(
+    findings: list,
+    bulk_checks_metadata: dict,
+    compliance_frameworks: list,
+    output_filename: str,
+    output_directory: str,
+):
+    """display_compliance_tables aggregates all the compliance frameworks in one pass over the findings and then displays their tables"""
+    compliance_tables = aggregate_compliance_tables(
+        findings, bulk_checks_metadata, compliance_frameworks
+    )
+    for compliance_framework in compliance_frameworks:
+        display_compliance_table(
+            findings,
+            bulk_checks_metadata,
+            compliance_framework,
+            output_filename,
+            output_directory,
+            compliance_tables.get(compliance_framework),
+        )
+
+
 def display_compliance_table(
     findings: list,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
+    compliance_table: dict = None,
 ):
     try:
-        if "ens_rd2022_aws" == compliance_framework:
-            marcos = {}
+        table_type = get_compliance_table_type(compliance_framework)
+        if table_type and compliance_table is None:
+            compliance_table = aggregate_compliance_tables(
+                findings, bulk_checks_metadata, [compliance_framework]
+            )[compliance_framework]
+
+        if table_type:
+            compliance_fm = compliance_table["framework"]
+            compliance_version = compliance_table["version"]
+            compliance_provider = compliance_table["provider"]
+            fail_count = compliance_table["fail_count"]
+            pass_count = compliance_table["pass_count"]
+
+        if table_type == "ens":
+            marcos = compliance_table["groups"]
             ens_compliance_table = {
                 "Proveedor": [],
                 "Marco/Categoria": [],
@@ -178,54 +355,19 @@ def display_compliance_table(
                 "Bajo": [],
                 "Opcional": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "ENS"
-                        and compliance.Provider == "AWS"
-                        and compliance.Version == "RD2022"
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        compliance_provider = compliance.Provider
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                marco_categoria = (
-                                    f"{attribute.Marco}/{attribute.Categoria}"
-                                )
-                                # Check if Marco/Categoria exists
-                                if marco_categoria not in marcos:
-                                    marcos[marco_categoria] = {
-                                        "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                        "Opcional": 0,
-                                        "Alto": 0,
-                                        "Medio": 0,
-                                        "Bajo": 0,
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Nivel == "opcional":
-                                    marcos[marco_categoria]["Opcional"] += 1
-                                elif attribute.Nivel == "alto":
-                                    marcos[marco_categoria]["Alto"] += 1
-                                elif attribute.Nivel == "medio":
-                                    marcos[marco_categoria]["Medio"] += 1
-                                elif attribute.Nivel == "bajo":
-                                    marcos[marco_categoria]["Bajo"] += 1
 
             # Add results to table
             for marco in marcos:
                 ens_compliance_table["Proveedor"].append("aws")
                 ens_compliance_table["Marco/Categoria"].append(marco)
-                ens_compliance_table["Estado"].append(marcos[marco]["Estado"])
+                if marcos[marco]["Estado"] == "NO CUMPLE":
+                    ens_compliance_table["Estado"].append(
+                        f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                    )
+                else:
+                    ens_compliance_table["Estado"].append(
+                        f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}"
+                    )
                 ens_compliance_table["Opcional"].append(
                     f"{Fore.BLUE}{marcos[marco]['Opcional']}{Style.RESET_ALL}"
                 )
@@ -238,9 +380,9 @@ def display_compliance_table(
                 ens_compliance_table["Bajo"].append(
                     f"{Fore.YELLOW}{marcos[marco]['Bajo']}{Style.RESET_ALL}"
                 )
-            if fail_count + pass_count < 0:
+            if fail_count + pass_count < 1:
                 print(
-                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm} {compliance_version} - {compliance_provider}{Style.RESET_ALL}.\n"
+                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_framework}{Style.RESET_ALL}.\n"
                 )
             else:
                 print(
@@ -268,52 +410,16 @@ def display_compliance_table(
                 print(
                     f" - CSV: {output_directory}/{output_filename}_{compliance_framework}.csv\n"
                 )
-        elif "cis_1." in compliance_framework:
-            sections = {}
+        elif table_type == "cis":
             cis_compliance_table = {
                 "Provider": [],
                 "Section": [],
                 "Level 1": [],
                 "Level 2": [],
             }
-            pass_count = fail_count = 0
-            for finding in findings:
-                check = bulk_checks_metadata[finding.check_metadata.CheckID]
-                check_compliances = check.Compliance
-                for compliance in check_compliances:
-                    if (
-                        compliance.Framework == "CIS"
-                        and compliance.Version in compliance_framework
-                    ):
-                        compliance_version = compliance.Version
-                        compliance_fm = compliance.Framework
-                        for requirement in compliance.Requirements:
-                            for attribute in requirement.Attributes:
-                                section = attribute.Section
-                                # Check if Section exists
-                                if section not in sections:
-                                    sections[section] = {
-                                        "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                        "Level 1": {"FAIL": 0, "PASS": 0},
-                                        "Level 2": {"FAIL": 0, "PASS": 0},
-                                    }
-                                if finding.status == "FAIL":
-                                    fail_count += 1
-                                elif finding.status == "PASS":
-                                    pass_count += 1
-                                if attribute.Profile == "Level 1":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 1"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 1"]["PASS"] += 1
-                                elif attribute.Profile == "Level 2":
-                                    if finding.status == "FAIL":
-                                        sections[section]["Level 2"]["FAIL"] += 1
-                                    else:
-                                        sections[section]["Level 2"]["PASS"] += 1
 
             # Add results to table
-            sections = dict(sorted(sections.items()))
+            sections = dict(sorted(compliance_table["groups"].items()))
             for section in sections:
                 cis_compliance_table["Provider"].append("aws")
                 cis_compliance_table["Section"].append(section)
@@ -335,7 +441,7 @@ def display_compliance_table(
                     )
             if fail_count + pass_count < 1:
                 print(
-                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_fm}-{compliance_version}{Style.RESET_ALL}.\n"
+                    f"\n {Style.BRIGHT}There are no resources for {Fore.YELLOW}{compliance_framework}{Style.RESET_ALL}.\n"
                 )
             else:
                 print(
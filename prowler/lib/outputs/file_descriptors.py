@@ -9,7 +9,7 @@ from prowler.config.config import (
     json_file_suffix,
 )
 from prowler.lib.logger import logger
-from prowler.lib.outputs.html import add_html_header
+from prowler.lib.outputs.html import add_html_header, initialize_html_compact_page
 from prowler.lib.outputs.models import (
     Aws_Check_Output_CSV,
     Azure_Check_Output_CSV,
@@ -61,7 +61,13 @@ def initialize_file_descriptor(
     return file_descriptor
 
 
-def fill_file_descriptors(output_modes, output_directory, output_filename, audit_info):
+def fill_file_descriptors(
+    output_modes,
+    output_directory,
+    output_filename,
+    audit_info,
+    html_compact_report=None,
+):
     try:
         file_descriptors = {}
         if output_modes:
@@ -108,6 +114,13 @@ def fill_file_descriptors(output_modes, output_directory, output_filename, audit
                         )
                         file_descriptors.update({output_mode: file_descriptor})
 
+                    elif output_mode == "html-compact":
+                        # The compact HTML report keeps track of its current page
+                        file_descriptor = initialize_html_compact_page(
+                            html_compact_report, audit_info
+                        )
+                        file_descriptors.update({output_mode: file_descriptor})
+
                     elif output_mode == "ens_rd2022_aws":
                         filename = f"{output_directory}/{output_filename}_ens_rd2022_aws{csv_file_suffix}"
                         file_descriptor = initialize_file_descriptor(
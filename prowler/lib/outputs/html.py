@@ -1,7 +1,11 @@
+import json
 import sys
+from dataclasses import dataclass, field
 from os import path
 
 from prowler.config.config import (
+    html_compact_file_suffix,
+    html_compact_max_findings_per_page,
     html_file_suffix,
     html_logo_img,
     html_logo_url,
@@ -9,10 +13,11 @@ from prowler.config.config import (
     timestamp,
 )
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import open_file
+from prowler.lib.utils.utils import file_exists, open_file
 
 
-def add_html_header(file_descriptor, audit_info):
+def add_html_header(file_descriptor, audit_info, compact: bool = False):
+    """add_html_header writes the HTML report header. The compact report renders the overview and the findings client-side"""
     try:
         if not audit_info.profile:
             audit_info.profile = "ENV"
@@ -22,7 +27,7 @@ def add_html_header(file_descriptor, audit_info):
             audited_regions = "All Regions"
         else:
             audited_regions = audit_info.audited_regions
-        file_descriptor.write(
+        html_header = (
             """
         <!DOCTYPE html>
     <html lang="en">
@@ -198,6 +203,25 @@ def add_html_header(file_descriptor, audit_info):
             <tbody>
     """
         )
+        if compact:
+            # The overview is filled from the statistics written at close time
+            html_header = (
+                html_header.replace(
+                    "TOTAL_FINDINGS", '<span id="total-findings"></span>'
+                )
+                .replace("TOTAL_RESOURCES", '<span id="total-resources"></span>')
+                .replace("TOTAL_PASS", '<span id="total-pass"></span>')
+                .replace("TOTAL_FAIL", '<span id="total-fail"></span>')
+            )
+            # Findings are streamed as compact rows into this data block
+            html_header += """
+            </tbody>
+            </table>
+            <div id="report-pages"></div>
+    <script>
+    var C = {}, F = [];
+"""
+        file_descriptor.write(html_header)
     except Exception as error:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -365,3 +389,258 @@ def add_html_footer(output_filename, output_directory):
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
         )
         sys.exit(1)
+
+
+@dataclass
+class HTML_Compact_Report:
+    """HTML_Compact_Report holds the running state of the compact HTML report while the findings are streamed"""
+
+    output_filename: str
+    output_directory: str
+    max_findings_per_page: int = html_compact_max_findings_per_page
+    page: int = 1
+    page_findings: int = 0
+    page_checks: set = field(default_factory=set)
+    total_pass: int = 0
+    total_fail: int = 0
+    findings_count: int = 0
+    resources: set = field(default_factory=set)
+
+
+def get_html_compact_page_name(output_filename: str, page: int) -> str:
+    """get_html_compact_page_name returns the compact HTML page filename without the directory and the suffix"""
+    if page == 1:
+        return output_filename
+    return f"{output_filename}_page{page}"
+
+
+def __html_compact_page_path__(html_compact_report: HTML_Compact_Report, page: int):
+    return f"{html_compact_report.output_directory}/{get_html_compact_page_name(html_compact_report.output_filename, page)}{html_compact_file_suffix}"
+
+
+def __html_compact_data__(data) -> str:
+    """__html_compact_data__ serializes data to be embedded in a <script> block"""
+    return json.dumps(data, separators=(",", ":")).replace("<", "\\u003c")
+
+
+def initialize_html_compact_page(html_compact_report: HTML_Compact_Report, audit_info):
+    """initialize_html_compact_page opens the current page of the compact HTML report, writing its header if it is new"""
+    try:
+        filename = __html_compact_page_path__(
+            html_compact_report, html_compact_report.page
+        )
+        new_page = not file_exists(filename)
+        file_descriptor = open_file(
+            filename,
+            "a",
+        )
+        if new_page:
+            add_html_header(file_descriptor, audit_info, compact=True)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+    return file_descriptor
+
+
+def update_html_compact_statistics(html_compact_report: HTML_Compact_Report, finding):
+    """update_html_compact_statistics keeps the running statistics of the compact HTML report, as extract_findings_statistics does"""
+    html_compact_report.resources.add(finding.resource_id)
+    if finding.status == "PASS":
+        html_compact_report.total_pass += 1
+        html_compact_report.findings_count += 1
+    elif finding.status == "FAIL":
+        html_compact_report.total_fail += 1
+        html_compact_report.findings_count += 1
+
+
+def fill_html_compact(
+    file_descriptor, html_compact_report: HTML_Compact_Report, finding, audit_info
+):
+    """
+    fill_html_compact appends the finding to the compact HTML report data block and returns the file descriptor to keep writing to.
+
+    The check's metadata is written once per page, and a new page is started when the current one is full.
+    """
+    if html_compact_report.page_findings >= html_compact_report.max_findings_per_page:
+        file_descriptor.close()
+        html_compact_report.page += 1
+        html_compact_report.page_findings = 0
+        html_compact_report.page_checks = set()
+        file_descriptor = initialize_html_compact_page(html_compact_report, audit_info)
+
+    check_id = finding.check_metadata.CheckID
+    if check_id not in html_compact_report.page_checks:
+        html_compact_report.page_checks.add(check_id)
+        check_data = [
+            finding.check_metadata.Severity,
+            finding.check_metadata.ServiceName,
+            finding.check_metadata.CheckTitle,
+            finding.check_metadata.Description,
+            finding.check_metadata.Risk,
+            finding.check_metadata.Remediation.Recommendation.Text,
+            finding.check_metadata.Remediation.Recommendation.Url,
+        ]
+        file_descriptor.write(
+            f"C[{__html_compact_data__(check_id)}]={__html_compact_data__(check_data)};\n"
+        )
+    finding_data = [
+        check_id,
+        finding.status,
+        finding.region,
+        finding.resource_id,
+        finding.status_extended,
+    ]
+    file_descriptor.write(f"F.push({__html_compact_data__(finding_data)});\n")
+    html_compact_report.page_findings += 1
+
+    return file_descriptor
+
+
+def add_html_compact_footer(html_compact_report: HTML_Compact_Report):
+    """add_html_compact_footer closes every page of the compact HTML report appending the statistics aggregated while streaming"""
+    try:
+        pages = [
+            f"{get_html_compact_page_name(html_compact_report.output_filename, page)}{html_compact_file_suffix}"
+            for page in range(1, html_compact_report.page + 1)
+        ]
+        for page in range(1, html_compact_report.page + 1):
+            filename = __html_compact_page_path__(html_compact_report, page)
+            if path.isfile(filename):
+                stats = {
+                    "findings_count": html_compact_report.findings_count,
+                    "total_pass": html_compact_report.total_pass,
+                    "total_fail": html_compact_report.total_fail,
+                    "resources_count": len(html_compact_report.resources),
+                    "page": page,
+                    "pages": pages,
+                }
+                file_descriptor = open_file(
+                    filename,
+                    "a",
+                )
+                file_descriptor.write(
+                    """
+    var S = """
+                    + __html_compact_data__(stats)
+                    + """;
+    </script>
+        </div>
+    </div>
+    </div>
+    </div>
+    <!-- Optional JavaScript -->
+    <!-- jQuery first, then Popper.js, then Bootstrap JS -->
+    <script src="https://code.jquery.com/jquery-3.5.1.min.js"
+        integrity="sha256-9/aliU8dGd2tb6OSsuzixeV4y/faTqgFtohetphbbj0=" crossorigin="anonymous"></script>
+    <script src="https://stackpath.bootstrapcdn.com/bootstrap/4.5.0/js/bootstrap.bundle.min.js"
+        integrity="sha384-1CmrxMRARb6aLqgBO7yyAxTOQE2AKb9GfXnEo760AUcUmFx3ibVJJAzGytlQcNXd"
+        crossorigin="anonymous"></script>
+    <!-- https://datatables.net/download/index with jQuery, DataTables, Buttons, SearchPanes, and Select //-->
+    <script type="text/javascript"
+        src="https://cdn.datatables.net/v/dt/jqc-1.12.4/dt-1.10.25/b-1.7.1/sp-1.4.0/sl-1.3.3/datatables.min.js"></script>
+    <script>
+        $(document).ready(function () {
+            // Overview statistics
+            $("#total-findings").text(S.findings_count);
+            $("#total-pass").text(S.total_pass);
+            $("#total-fail").text(S.total_fail);
+            $("#total-resources").text(S.resources_count);
+            // Report pages
+            if (S.pages.length > 1) {
+                var pages = $("#report-pages").addClass("mb-3").text("Report pages: ");
+                $.each(S.pages, function (index, page) {
+                    var link = $("<a class='mr-2'></a>").text(index + 1);
+                    if (index + 1 === S.page) {
+                        link = $("<b class='mr-2'></b>").text(index + 1);
+                    } else {
+                        link.attr("href", page);
+                    }
+                    pages.append(link);
+                });
+            }
+            // Findings rows from the compact data block
+            var rows = $.map(F, function (finding) {
+                var check = C[finding[0]];
+                return [[finding[1], check[0], check[1], finding[2], check[2], finding[3], check[3], finding[0], finding[4], check[4], check[5], check[6]]];
+            });
+            F = null;
+            var rowClasses = {
+                PASS: "p-3 mb-2 bg-success-custom",
+                INFO: "table-info",
+                FAIL: "table-danger",
+                WARNING: "table-warning"
+            };
+            $('#findingsTable').DataTable({
+                data: rows,
+                deferRender: true,
+                responsive: true,
+                // Show 25, 50, 100 and All records
+                lengthChange: true,
+                lengthMenu: [[25, 50, 100, -1], [25, 50, 100, "All"]],
+                searchPanes: {
+                    cascadePanes: true,
+                    viewTotal: true,
+                },
+                dom: 'Blfrtip',
+                language: {
+                    // To enable a filter button instead of the filter row
+                    searchPanes: {
+                        clearMessage: 'Clear Filters',
+                        collapse: { 0: 'Filters', _: 'Filters (%d)' },
+                        initCollapsed: true
+
+                    }
+                },
+                buttons: [
+                    {
+                        extend: 'searchPanes',
+                        config: {
+                            cascadePanes: true,
+                            viewTotal: true,
+                            orderable: false
+                        }
+                    }
+                ],
+                columnDefs: [
+                    {
+                        searchPanes: {
+                            show: true,
+                            pagingType: 'numbers',
+                            searching: true
+                        },
+                        // Show all filters
+                        targets: [0, 1, 2, 3, 5, 7]
+                    },
+                    {
+                        render: $.fn.dataTable.render.text(),
+                        targets: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+                    },
+                    {
+                        render: function (data, type) {
+                            if (type !== "display") {
+                                return data;
+                            }
+                            return $("<a class='read-more'><i class='fas fa-external-link-alt'></i></a>").attr("href", data).prop("outerHTML");
+                        },
+                        targets: [11]
+                    }
+                ],
+                createdRow: function (row, data) {
+                    $(row).addClass(rowClasses[data[0]] || "");
+                }
+            });
+        });
+    </script>
+</body>
+
+</html>
+"""
+                )
+                file_descriptor.close()
+    except Exception as error:
+        logger.critical(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+        )
+        sys.exit(1)
@@ -6,6 +6,7 @@ from colorama import Fore, Style
 from prowler.config.config import (
     available_compliance_frameworks,
     csv_file_suffix,
+    html_compact_file_suffix,
     html_file_suffix,
     json_asff_file_suffix,
     json_file_suffix,
@@ -14,7 +15,11 @@ from prowler.config.config import (
 from prowler.lib.logger import logger
 from prowler.lib.outputs.compliance import add_manual_controls, fill_compliance
 from prowler.lib.outputs.file_descriptors import fill_file_descriptors
-from prowler.lib.outputs.html import fill_html
+from prowler.lib.outputs.html import (
+    fill_html,
+    fill_html_compact,
+    update_html_compact_statistics,
+)
 from prowler.lib.outputs.json import fill_json_asff
 from prowler.lib.outputs.models import (
     Check_Output_JSON_ASFF,
@@ -58,6 +63,7 @@ def report(check_findings, output_options, audit_info):
                 output_options.output_directory,
                 output_options.output_filename,
                 audit_info,
+                getattr(output_options, "html_compact_report", None),
             )
 
         if check_findings:
@@ -72,6 +78,11 @@ def report(check_findings, output_options, audit_info):
                         finding.resource_id,
                     ):
                         finding.status = "WARNING"
+                # Keep the running statistics of the compact HTML report
+                if "html-compact" in file_descriptors:
+                    update_html_compact_statistics(
+                        output_options.html_compact_report, finding
+                    )
                 # Print findings by stdout
                 color = set_report_color(finding.status)
                 stdout_report(
@@ -104,6 +115,14 @@ def report(check_findings, output_options, audit_info):
                                 fill_html(file_descriptors["html"], finding)
                                 file_descriptors["html"].write("")
 
+                            if "html-compact" in file_descriptors:
+                                file_descriptors["html-compact"] = fill_html_compact(
+                                    file_descriptors["html-compact"],
+                                    output_options.html_compact_report,
+                                    finding,
+                                    audit_info,
+                                )
+
                             if "json-asff" in file_descriptors:
                                 finding_output = Check_Output_JSON_ASFF()
                                 fill_json_asff(finding_output, audit_info, finding)
@@ -115,18 +134,36 @@ def report(check_findings, output_options, audit_info):
                                 )
                                 file_descriptors["json-asff"].write(",")
 
+                                # Keep the emitted Ids to reconcile Security Hub later
+                                if output_options.security_hub_enabled:
+                                    output_options.security_hub_findings_ids.setdefault(
+                                        finding.region, set()
+                                    ).add(finding_output.Id)
+
                             # Check if it is needed to send findings to security hub
                             if (
                                 output_options.security_hub_enabled
                                 and finding.status != "INFO"
                             ):
-                                send_to_security_hub(
-                                    output_options.is_quiet,
-                                    finding.status,
-                                    finding.region,
-                                    finding_output,
-                                    audit_info.audit_session,
-                                )
+                                security_hub_state = output_options.security_hub_state
+                                # Only send new, changed or stale findings if there is a local state
+                                if (
+                                    not security_hub_state
+                                    or security_hub_state.needs_update(finding_output)
+                                ):
+                                    if (
+                                        send_to_security_hub(
+                                            output_options.is_quiet,
+                                            finding.status,
+                                            finding.region,
+                                            finding_output,
+                                            audit_info.audit_session,
+                                        )
+                                        and security_hub_state
+                                    ):
+                                        security_hub_state.update(
+                                            finding_output, finding.region
+                                        )
 
                         # Common outputs
                         if "csv" in file_descriptors:
@@ -203,6 +240,8 @@ def send_to_s3_bucket(
             filename = f"{output_filename}{json_asff_file_suffix}"
         elif output_mode == "html":
             filename = f"{output_filename}{html_file_suffix}"
+        elif output_mode == "html-compact":
+            filename = f"{output_filename}{html_compact_file_suffix}"
         logger.info(f"Sending outputs to S3 bucket {output_bucket}")
         bucket_remote_dir = output_directory
         while "prowler/" in bucket_remote_dir:  # Check if it is not a custom directory
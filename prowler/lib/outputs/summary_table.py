@@ -104,6 +104,10 @@ def display_summary_table(
             print("\nDetailed results are in:")
             if "html" in output_options.output_modes:
                 print(f" - HTML: {output_directory}/{output_filename}.html")
+            if "html-compact" in output_options.output_modes:
+                print(
+                    f" - HTML (compact): {output_directory}/{output_filename}.compact.html"
+                )
             if "json-asff" in output_options.output_modes:
                 print(f" - JSON-ASFF: {output_directory}/{output_filename}.asff.json")
             if "csv" in output_options.output_modes:
@@ -49,3 +49,10 @@ def file_exists(filename: str):
 # create sha512 hash for string
 def hash_sha512(string: str) -> str:
     return sha512(string.encode("utf-8")).hexdigest()[0:9]
+
+
+def intern_string(value: Any) -> Any:
+    """intern_string returns the value interned if it is a string, so all the resources share the repeated values"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
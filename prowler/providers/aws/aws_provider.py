@@ -1,15 +1,20 @@
+import json
 import os
 import pathlib
 import sys
+import time
+from tempfile import gettempdir
+from typing import Optional
 
 from boto3 import session
 from botocore.credentials import RefreshableCredentials
 from botocore.session import get_session
 
-from prowler.config.config import aws_services_json_file
+from prowler.config.config import aws_services_json_file, enabled_regions_cache_ttl
 from prowler.lib.logger import logger
 from prowler.lib.utils.utils import open_file, parse_json_file
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
+from prowler.providers.aws.lib.rate_limiter.rate_limiter import attach_rate_limiter
 
 
 ################## AWS PROVIDER
@@ -122,6 +127,11 @@ def generate_regional_clients(
             )  # Get common regions between input and json
         else:  # Get all regions from json of the service and partition
             regions = json_regions
+        # Skip the opt-in regions not enabled in the account
+        if audit_info.enabled_regions:
+            regions = [
+                region for region in regions if region in audit_info.enabled_regions
+            ]
         # Check if it is global service to gather only one region
         if global_service:
             if regions:
@@ -133,6 +143,8 @@ def generate_regional_clients(
                 service, region_name=region, config=audit_info.session_config
             )
             regional_client.region = region
+            # Every client of the service and region shares the same rate limiter
+            attach_rate_limiter(regional_client, service, region)
             regional_clients[region] = regional_client
         return regional_clients
     except Exception as error:
@@ -141,6 +153,41 @@ def generate_regional_clients(
         )
 
 
+def get_enabled_regions(audit_info: AWS_Audit_Info) -> Optional[set]:
+    """get_enabled_regions returns the regions enabled in the audited account, cached per account"""
+    cache_file = f"{gettempdir()}/prowler-enabled-regions-{audit_info.audited_partition}-{audit_info.audited_account}.json"
+    try:
+        if (
+            os.path.exists(cache_file)
+            and time.time() - os.path.getmtime(cache_file) < enabled_regions_cache_ttl
+        ):
+            with open(cache_file) as f:
+                return set(json.load(f))
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+    try:
+        ec2_client = audit_info.audit_session.client(
+            "ec2",
+            region_name=audit_info.profile_region,
+            config=audit_info.session_config,
+        )
+        enabled_regions = {
+            region["RegionName"]
+            for region in ec2_client.describe_regions(AllRegions=True)["Regions"]
+            if region.get("OptInStatus") != "not-opted-in"
+        }
+        with open(cache_file, "w") as f:
+            json.dump(sorted(enabled_regions), f)
+        return enabled_regions
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+        return None
+
+
 def get_aws_available_regions():
     try:
         actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
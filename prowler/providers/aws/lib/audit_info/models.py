@@ -48,3 +48,5 @@ class AWS_Audit_Info:
     audit_resources: list
     organizations_metadata: AWS_Organizations_Info
     audit_metadata: Optional[Any] = None
+    # Regions enabled in the audited account, None if they could not be discovered
+    enabled_regions: Optional[set] = None
@@ -0,0 +1,129 @@
+import threading
+import time
+
+from prowler.config.config import get_config_var
+from prowler.lib.logger import logger
+
+# Error codes returned by the AWS APIs when the requests are throttled
+throttling_error_codes = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "RequestLimitExceeded",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "RequestThrottled",
+    "SlowDown",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+}
+
+# Requests per second used when the service has no ceiling in config.yaml
+default_rate_limit = 100
+# The rate is never decreased below this requests per second
+minimum_rate_limit = 1
+# Multiplicative decrease applied on throttling and the seconds between decreases
+throttling_decrease_factor = 0.5
+throttling_decrease_cooldown = 1
+
+
+class Rate_Limiter:
+    """
+    Rate_Limiter is a token bucket shared by all the threads calling the same service and region.
+
+    Its rate is tuned with AIMD: it grows by one request per second every second without throttling,
+    up to the ceiling, and it is halved when a request is throttled.
+    """
+
+    def __init__(self, max_rate: float):
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.tokens = max_rate
+        self.last_refill = time.monotonic()
+        self.last_decrease = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """acquire waits until there is a token for the request"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.rate, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            # The token is reserved even if it is not available yet, so the waiting requests are spaced
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+    def on_success(self):
+        """on_success increases the rate additively"""
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + 1 / self.rate)
+
+    def on_throttle(self):
+        """on_throttle decreases the rate multiplicatively, once per cooldown period"""
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_decrease >= throttling_decrease_cooldown:
+                self.rate = max(
+                    minimum_rate_limit, self.rate * throttling_decrease_factor
+                )
+                self.tokens = min(self.tokens, self.rate)
+                self.last_decrease = now
+
+
+rate_limiters = {}
+rate_limiters_lock = threading.Lock()
+rate_limits = None
+
+
+def get_rate_limiter(service: str, region: str) -> Rate_Limiter:
+    """get_rate_limiter returns the rate limiter shared by every client of the service and region"""
+    global rate_limits
+    with rate_limiters_lock:
+        if (service, region) not in rate_limiters:
+            if rate_limits is None:
+                rate_limits = get_config_var("aws_api_rate_limits") or {}
+            rate_limiters[(service, region)] = Rate_Limiter(
+                rate_limits.get(service, rate_limits.get("default", default_rate_limit))
+            )
+        return rate_limiters[(service, region)]
+
+
+def is_throttling_response(response) -> bool:
+    """is_throttling_response returns True if the botocore response is a throttling error"""
+    if response:
+        return response[1].get("Error", {}).get("Code") in throttling_error_codes
+    return False
+
+
+def attach_rate_limiter(client, service: str, region: str):
+    """attach_rate_limiter makes every request of the client, including the retries, go through the shared rate limiter"""
+    try:
+        rate_limiter = get_rate_limiter(service, region)
+
+        def __before_send__(**kwargs):
+            rate_limiter.acquire()
+
+        def __needs_retry__(response=None, **kwargs):
+            if is_throttling_response(response):
+                rate_limiter.on_throttle()
+
+        def __after_call__(http_response=None, **kwargs):
+            if http_response is not None and http_response.status_code < 300:
+                rate_limiter.on_success()
+
+        client.meta.events.register("before-send", __before_send__)
+        client.meta.events.register("needs-retry", __needs_retry__)
+        client.meta.events.register("after-call", __after_call__)
+    except Exception as error:
+        logger.error(
+            f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
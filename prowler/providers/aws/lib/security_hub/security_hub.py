@@ -1,14 +1,8 @@
-import json
-from itertools import groupby
-from operator import itemgetter
+import threading
 
 from boto3 import session
 
-from prowler.config.config import (
-    json_asff_file_suffix,
-    output_file_timestamp,
-    timestamp_utc,
-)
+from prowler.config.config import security_hub_max_concurrent_regions, timestamp_utc
 from prowler.lib.logger import logger
 from prowler.lib.outputs.models import Check_Output_JSON_ASFF
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
@@ -60,50 +54,74 @@ def send_to_security_hub(
 
 # Move previous Security Hub check findings to ARCHIVED (as prowler didn't re-detect them)
 def resolve_security_hub_previous_findings(
-    output_directory: str, audit_info: AWS_Audit_Info
-) -> list:
+    security_hub_findings_ids: dict, audit_info: AWS_Audit_Info
+) -> int:
     """
-    resolve_security_hub_previous_findings archives all the findings that does not appear in the current execution
+    resolve_security_hub_previous_findings archives all the findings that does not appear in the current execution and returns the number of archived findings
+
+    security_hub_findings_ids holds the set of ASFF Ids emitted in the current execution by region, regions are reconciled in parallel
     """
     logger.info("Checking previous findings in Security Hub to archive them.")
-    # Read current findings from json-asff file
-    with open(
-        f"{output_directory}/prowler-output-{audit_info.audited_account}-{output_file_timestamp}{json_asff_file_suffix}"
-    ) as f:
-        json_asff_file = json.load(f)
-
-    # Sort by region
-    json_asff_file = sorted(json_asff_file, key=itemgetter("ProductArn"))
-    # Group by region
-    for product_arn, current_findings in groupby(
-        json_asff_file, key=itemgetter("ProductArn")
-    ):
-        region = product_arn.split(":")[3]
+    archived_findings = {}
+    semaphore = threading.BoundedSemaphore(security_hub_max_concurrent_regions)
+    threads = []
+    for region, current_findings_ids in security_hub_findings_ids.items():
         try:
-            # Check if security hub is enabled in current region
+            # Clients are created before the threads since session.client() is not thread-safe
             security_hub_client = audit_info.audit_session.client(
                 "securityhub", region_name=region
             )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
+            )
+        else:
+            threads.append(
+                threading.Thread(
+                    target=__resolve_region_previous_findings__,
+                    args=(
+                        semaphore,
+                        security_hub_client,
+                        region,
+                        current_findings_ids,
+                        audit_info.audited_account,
+                        archived_findings,
+                    ),
+                )
+            )
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return sum(archived_findings.values())
+
+
+def __resolve_region_previous_findings__(
+    semaphore: threading.BoundedSemaphore,
+    security_hub_client,
+    region: str,
+    current_findings_ids: set,
+    audited_account: str,
+    archived_findings: dict,
+):
+    with semaphore:
+        archived_findings[region] = 0
+        try:
+            # Check if security hub is enabled in current region
             security_hub_client.describe_hub()
-            # Get current findings IDs
-            current_findings_ids = []
-            for finding in current_findings:
-                current_findings_ids.append(finding["Id"])
             # Get findings of that region
-            security_hub_client = audit_info.audit_session.client(
-                "securityhub", region_name=region
-            )
             findings_filter = {
                 "ProductName": [{"Value": "Prowler", "Comparison": "EQUALS"}],
                 "RecordState": [{"Value": "ACTIVE", "Comparison": "EQUALS"}],
-                "AwsAccountId": [
-                    {"Value": audit_info.audited_account, "Comparison": "EQUALS"}
-                ],
+                "AwsAccountId": [{"Value": audited_account, "Comparison": "EQUALS"}],
                 "Region": [{"Value": region, "Comparison": "EQUALS"}],
             }
             get_findings_paginator = security_hub_client.get_paginator("get_findings")
             findings_to_archive = []
-            for page in get_findings_paginator.paginate(Filters=findings_filter):
+            for page in get_findings_paginator.paginate(
+                Filters=findings_filter, PaginationConfig={"PageSize": 100}
+            ):
                 # Archive findings that have not appear in this execution
                 for finding in page["Findings"]:
                     if finding["Id"] not in current_findings_ids:
@@ -111,24 +129,30 @@ def resolve_security_hub_previous_findings(
                         finding["UpdatedAt"] = timestamp_utc.strftime(
                             "%Y-%m-%dT%H:%M:%SZ"
                         )
-
                         findings_to_archive.append(finding)
-            logger.info(f"Archiving {len(findings_to_archive)} findings.")
+            # Archive once paging is done, since archived findings leave the ACTIVE filter
+            logger.info(
+                f"Archiving {len(findings_to_archive)} findings in region {region}."
+            )
             # Send archive findings to SHub
-            list_chunked = [
-                findings_to_archive[i : i + 100]
-                for i in range(0, len(findings_to_archive), 100)
-            ]
-            for findings in list_chunked:
-                batch_import = security_hub_client.batch_import_findings(
-                    Findings=findings
+            for i in range(0, len(findings_to_archive), 100):
+                archived_findings[region] += __archive_findings__(
+                    security_hub_client, findings_to_archive[i : i + 100]
                 )
-                if batch_import["FailedCount"] > 0:
-                    failed_import = batch_import["FailedFindings"][0]
-                    logger.error(
-                        f"Failed to send archived findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
-                    )
+            logger.info(
+                f"Archived {archived_findings[region]} findings in region {region}."
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__} -- [{error.__traceback__.tb_lineno}]:{error} in region {region}"
             )
+
+
+def __archive_findings__(security_hub_client, findings: list) -> int:
+    batch_import = security_hub_client.batch_import_findings(Findings=findings)
+    if batch_import["FailedCount"] > 0:
+        failed_import = batch_import["FailedFindings"][0]
+        logger.error(
+            f"Failed to send archived findings to AWS Security Hub -- {failed_import['ErrorCode']} -- {failed_import['ErrorMessage']}"
+        )
+    return batch_import["SuccessCount"]
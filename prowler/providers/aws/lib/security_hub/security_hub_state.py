@@ -0,0 +1,104 @@
+import json
+import sqlite3
+from hashlib import sha256
+
+from prowler.config.config import timestamp_utc
+from prowler.lib.logger import logger
+from prowler.lib.outputs.models import Check_Output_JSON_ASFF
+
+# ASFF fields that change on every execution and must not be part of the content hash
+volatile_asff_fields = {"FirstObservedAt", "CreatedAt", "UpdatedAt"}
+
+
+def hash_security_hub_finding(finding_output: Check_Output_JSON_ASFF) -> str:
+    """hash_security_hub_finding returns the content hash of an ASFF finding without its timestamps"""
+    finding_content = {
+        key: value
+        for key, value in finding_output.dict().items()
+        if key not in volatile_asff_fields
+    }
+    return sha256(
+        json.dumps(finding_content, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class Security_Hub_State:
+    """
+    Security_Hub_State is a local SQLite store of the findings sent to Security Hub, keyed by the ASFF Id.
+
+    It keeps the content hash and the status last sent, so only new, changed or stale findings are sent again.
+    """
+
+    def __init__(self, state_file: str, refresh_days: int = 30):
+        self.state_file = state_file
+        self.refresh_seconds = refresh_days * 86400
+        # All the findings processed in this execution are marked with its timestamp
+        self.execution_time = int(timestamp_utc.timestamp())
+        self.connection = sqlite3.connect(state_file)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS findings (
+                id TEXT PRIMARY KEY,
+                region TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                status TEXT NOT NULL,
+                sent_at INTEGER NOT NULL,
+                seen_at INTEGER NOT NULL
+            )"""
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS findings_region_seen_at ON findings (region, seen_at)"
+        )
+        self.connection.commit()
+
+    def needs_update(self, finding_output: Check_Output_JSON_ASFF) -> bool:
+        """needs_update returns True if the finding is new, has changed or was sent longer than the refresh interval ago"""
+        row = self.connection.execute(
+            "SELECT content_hash, status, sent_at FROM findings WHERE id = ?",
+            (finding_output.Id,),
+        ).fetchone()
+        if (
+            row
+            and row[0] == hash_security_hub_finding(finding_output)
+            and row[1] == finding_output.Compliance.Status
+            and self.execution_time - row[2] < self.refresh_seconds
+        ):
+            # The finding is still present, it must not be purged
+            self.connection.execute(
+                "UPDATE findings SET seen_at = ? WHERE id = ?",
+                (self.execution_time, finding_output.Id),
+            )
+            return False
+        return True
+
+    def update(self, finding_output: Check_Output_JSON_ASFF, region: str):
+        """update stores the finding as sent to Security Hub in this execution"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                finding_output.Id,
+                region,
+                hash_security_hub_finding(finding_output),
+                finding_output.Compliance.Status,
+                self.execution_time,
+                self.execution_time,
+            ),
+        )
+
+    def purge(self, regions: list) -> int:
+        """purge removes the findings of the given regions not seen in this execution, since they are archived in Security Hub"""
+        purged_findings = 0
+        for region in regions:
+            purged_findings += self.connection.execute(
+                "DELETE FROM findings WHERE region = ? AND seen_at < ?",
+                (region, self.execution_time),
+            ).rowcount
+        self.connection.commit()
+        logger.info(
+            f"Purged {purged_findings} resolved findings from the Security Hub state file {self.state_file}."
+        )
+        return purged_findings
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
@@ -0,0 +1,181 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from prowler.config.config import aws_service_max_workers
+from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+
+
+@dataclass
+class List_Operation:
+    """
+    List_Operation declares a list API call returning the resources of a service.
+
+    @param operation: boto3 operation name, e.g. "list_topics"
+
+    @param result_key: key of the resources in every response page, e.g. "Topics"
+
+    @param attribute: service attribute where the resources are stored, a list or a dict if key is set
+
+    @param arn: function returning the ARN of a raw item, used for the resource filtering
+
+    @param resource: function building the resource model from a raw item and its region
+
+    @param key: function returning the key of the resource if the attribute is a dict
+
+    @param parameters: parameters of the call, used to push the filters down to the API
+
+    @param page_size: maximum page size supported by the API, to make the fewest calls
+    """
+
+    operation: str
+    result_key: str
+    attribute: str
+    arn: Callable
+    resource: Callable
+    key: Optional[Callable] = None
+    parameters: dict = field(default_factory=dict)
+    page_size: Optional[int] = None
+
+
+@dataclass
+class Enrichment_Operation:
+    """
+    Enrichment_Operation declares an API call made for every resource of a service attribute.
+
+    @param operation: boto3 operation name, e.g. "get_topic_attributes"
+
+    @param attribute: service attribute with the resources to enrich
+
+    @param parameters: function returning the parameters of the call for a resource
+
+    @param enrich: function updating the resource with the response
+    """
+
+    operation: str
+    attribute: str
+    parameters: Callable
+    enrich: Callable
+
+
+def get_checks_attributes(audit_info, checks_attributes: dict) -> set:
+    """get_checks_attributes returns the service attributes read by the checks to execute, or all of them if the checks are unknown"""
+    audit_metadata = getattr(audit_info, "audit_metadata", None)
+    if not audit_metadata:
+        return {
+            attribute
+            for attributes in checks_attributes.values()
+            for attribute in attributes
+        }
+    return {
+        attribute
+        for check in audit_metadata.expected_checks
+        for attribute in checks_attributes.get(check, [])
+    }
+
+
+class AWS_Service:
+    """
+    AWS_Service collects the resources of the operations declared by the service.
+
+    Every list operation runs in every region and every enrichment operation for every resource,
+    sharing a pool of aws_service_max_workers threads, with the maximum page size and the resource filtering.
+    Services move to it by declaring list_operations and enrichment_operations instead of hand-written calls.
+    """
+
+    list_operations: list = []
+    enrichment_operations: list = []
+
+    def __init__(self, service: str, audit_info, regional_clients: dict):
+        self.service = service
+        self.session = audit_info.audit_session
+        self.audited_account = audit_info.audited_account
+        self.audit_resources = audit_info.audit_resources
+        self.regional_clients = regional_clients or {}
+        for list_operation in self.list_operations:
+            setattr(self, list_operation.attribute, {} if list_operation.key else [])
+        self.__collect__()
+
+    def __get_session__(self):
+        return self.session
+
+    def __collect__(self):
+        with ThreadPoolExecutor(max_workers=aws_service_max_workers) as executor:
+            # Resources must be listed before they are enriched
+            list(
+                executor.map(
+                    lambda call: self.__list_resources__(*call),
+                    [
+                        (list_operation, regional_client)
+                        for list_operation in self.list_operations
+                        for regional_client in self.regional_clients.values()
+                    ],
+                )
+            )
+            list(
+                executor.map(
+                    lambda call: self.__enrich_resource__(*call),
+                    [
+                        (enrichment_operation, resource)
+                        for enrichment_operation in self.enrichment_operations
+                        for resource in self.__get_resources__(
+                            enrichment_operation.attribute
+                        )
+                    ],
+                )
+            )
+
+    def __get_resources__(self, attribute: str) -> list:
+        resources = getattr(self, attribute)
+        if isinstance(resources, dict):
+            return list(resources.values())
+        return list(resources)
+
+    def __list_resources__(self, list_operation: List_Operation, regional_client):
+        logger.info(f"{self.service} - Calling {list_operation.operation}...")
+        try:
+            if regional_client.can_paginate(list_operation.operation):
+                pagination_config = {}
+                if list_operation.page_size:
+                    pagination_config["PageSize"] = list_operation.page_size
+                pages = regional_client.get_paginator(
+                    list_operation.operation
+                ).paginate(
+                    **list_operation.parameters, PaginationConfig=pagination_config
+                )
+            else:
+                pages = [
+                    getattr(regional_client, list_operation.operation)(
+                        **list_operation.parameters
+                    )
+                ]
+            resources = getattr(self, list_operation.attribute)
+            for page in pages:
+                for item in page.get(list_operation.result_key, []):
+                    if not self.audit_resources or (
+                        is_resource_filtered(
+                            list_operation.arn(item), self.audit_resources
+                        )
+                    ):
+                        resource = list_operation.resource(item, regional_client.region)
+                        if list_operation.key:
+                            resources[list_operation.key(item)] = resource
+                        else:
+                            resources.append(resource)
+        except Exception as error:
+            logger.error(
+                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def __enrich_resource__(self, enrichment_operation: Enrichment_Operation, resource):
+        try:
+            regional_client = self.regional_clients[resource.region]
+            response = getattr(regional_client, enrichment_operation.operation)(
+                **enrichment_operation.parameters(resource)
+            )
+            enrichment_operation.enrich(resource, response)
+        except Exception as error:
+            logger.error(
+                f"{resource.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
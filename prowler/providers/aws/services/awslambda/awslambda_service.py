@@ -12,6 +12,15 @@ from pydantic import BaseModel
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import get_checks_attributes
+
+# Function attributes read by each check, only these are collected for the checks to execute
+checks_attributes = {
+    "awslambda_function_no_secrets_in_code": ["code"],
+    "awslambda_function_not_publicly_accessible": ["policy"],
+    "awslambda_function_url_cors_policy": ["url_config"],
+    "awslambda_function_url_public": ["url_config"],
+}
 
 
 ################## Lambda
@@ -24,17 +33,13 @@ class Lambda:
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.functions = {}
         self.__threading_call__(self.__list_functions__)
-
-        # We only want to retrieve the Lambda code if the
-        # awslambda_function_no_secrets_in_code check is set
-        if (
-            "awslambda_function_no_secrets_in_code"
-            in audit_info.audit_metadata.expected_checks
-        ):
+        attributes = get_checks_attributes(audit_info, checks_attributes)
+        if "code" in attributes:
             self.__threading_call__(self.__get_function__)
-
-        self.__threading_call__(self.__get_policy__)
-        self.__threading_call__(self.__get_function_url_config__)
+        if "policy" in attributes:
+            self.__threading_call__(self.__get_policy__)
+        if "url_config" in attributes:
+            self.__threading_call__(self.__get_function_url_config__)
 
     def __get_session__(self):
         return self.session
@@ -4,6 +4,7 @@ from typing import Optional
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import intern_string
 from prowler.providers.aws.aws_provider import generate_regional_clients
 
 
@@ -155,6 +156,8 @@ class MetricAlarm:
     name_space: Optional[str]
     region: str
 
+    __slots__ = ("arn", "name", "metric", "name_space", "region")
+
     def __init__(
         self,
         arn,
@@ -166,8 +169,8 @@ class MetricAlarm:
         self.arn = arn
         self.name = name
         self.metric = metric
-        self.name_space = name_space
-        self.region = region
+        self.name_space = intern_string(name_space)
+        self.region = intern_string(region)
 
 
 @dataclass
@@ -178,6 +181,8 @@ class MetricFilter:
     log_group: str
     region: str
 
+    __slots__ = ("name", "metric", "pattern", "log_group", "region")
+
     def __init__(
         self,
         name,
@@ -190,7 +195,7 @@ class MetricFilter:
         self.metric = metric
         self.pattern = pattern
         self.log_group = log_group
-        self.region = region
+        self.region = intern_string(region)
 
 
 @dataclass
@@ -201,6 +206,8 @@ class LogGroup:
     kms_id: str
     region: str
 
+    __slots__ = ("arn", "name", "retention_days", "kms_id", "region")
+
     def __init__(
         self,
         arn,
@@ -213,4 +220,4 @@ class LogGroup:
         self.name = name
         self.retention_days = retention_days
         self.kms_id = kms_id
-        self.region = region
+        self.region = intern_string(region)
@@ -0,0 +1,83 @@
+import re
+from dataclasses import dataclass, field
+
+from prowler.lib.check.models import Check_Report_AWS
+
+
+################## Metric Filters
+@dataclass
+class Metric_Filters_Index:
+    """
+    Metric_Filters_Index holds the metric filters of the CloudTrail trails log groups and the metrics with alarms.
+
+    It is built once from the CloudTrail, CloudWatch Logs and CloudWatch services and shared by all the metric filter checks.
+    """
+
+    trails: list
+    metric_filters: list
+    metric_alarms: list
+    trails_metric_filters: list = field(default_factory=list)
+    metrics_with_alarms: set = field(default_factory=set)
+    # Metric filters of the trails log groups matching each check pattern
+    patterns_metric_filters: dict = field(default_factory=dict)
+
+
+metric_filters_index = None
+
+
+def get_metric_filters_index(
+    trails: list, metric_filters: list, metric_alarms: list
+) -> Metric_Filters_Index:
+    """get_metric_filters_index returns the shared index, building it again only if the services have changed"""
+    global metric_filters_index
+    if (
+        metric_filters_index is None
+        or metric_filters_index.trails is not trails
+        or metric_filters_index.metric_filters is not metric_filters
+        or metric_filters_index.metric_alarms is not metric_alarms
+    ):
+        index = Metric_Filters_Index(trails, metric_filters, metric_alarms)
+        # 1. CloudWatch Log Groups of the CloudTrail trails
+        log_groups = {
+            trail.log_group_arn.split(":")[6] for trail in trails if trail.log_group_arn
+        }
+        # 2. Metric filters of the previous log groups
+        index.trails_metric_filters = [
+            metric_filter
+            for metric_filter in metric_filters
+            if metric_filter.log_group in log_groups
+        ]
+        # 3. Metrics with alarms
+        index.metrics_with_alarms = {alarm.metric for alarm in metric_alarms}
+        metric_filters_index = index
+    return metric_filters_index
+
+
+def check_cloudwatch_log_metric_filter(
+    metric_filter_pattern: str,
+    trails: list,
+    metric_filters: list,
+    metric_alarms: list,
+    report: Check_Report_AWS,
+) -> Check_Report_AWS:
+    """check_cloudwatch_log_metric_filter fills the report with the last trail metric filter matching the pattern and whether its metric has alarms"""
+    index = get_metric_filters_index(trails, metric_filters, metric_alarms)
+    if metric_filter_pattern not in index.patterns_metric_filters:
+        pattern = re.compile(metric_filter_pattern)
+        index.patterns_metric_filters[metric_filter_pattern] = [
+            metric_filter
+            for metric_filter in index.trails_metric_filters
+            if pattern.search(metric_filter.pattern)
+        ]
+    matching_metric_filters = index.patterns_metric_filters[metric_filter_pattern]
+    if matching_metric_filters:
+        metric_filter = matching_metric_filters[-1]
+        report.resource_id = metric_filter.log_group
+        report.region = metric_filter.region
+        if metric_filter.metric in index.metrics_with_alarms:
+            report.status = "PASS"
+            report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} and alarms set."
+        else:
+            report.status = "FAIL"
+            report.status_extended = f"CloudWatch log group {metric_filter.log_group} found with metric filter {metric_filter.name} but no alarms associated."
+    return report
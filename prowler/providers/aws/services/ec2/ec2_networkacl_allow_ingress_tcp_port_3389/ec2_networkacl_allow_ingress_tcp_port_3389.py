@@ -1,6 +1,8 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.network_acls import check_network_acl
+from prowler.providers.aws.services.ec2.lib.network_acls import (
+    check_network_acl_exposure,
+)
 
 
 class ec2_networkacl_allow_ingress_tcp_port_3389(Check):
@@ -13,7 +15,7 @@ class ec2_networkacl_allow_ingress_tcp_port_3389(Check):
             report.region = network_acl.region
             report.resource_arn = network_acl.arn
             # If some entry allows it, that ACL is not securely configured
-            if not check_network_acl(network_acl.entries, tcp_protocol, check_port):
+            if not check_network_acl_exposure(network_acl, tcp_protocol, check_port):
                 report.status = "PASS"
                 report.status_extended = f"Network ACL {network_acl.id} has not Microsoft RDP port 3389 open to the Internet."
                 report.resource_id = network_acl.id
@@ -1,6 +1,8 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    check_security_group_exposure,
+)
 
 
 class ec2_securitygroup_allow_ingress_from_internet_to_any_port(Check):
@@ -13,12 +15,9 @@ class ec2_securitygroup_allow_ingress_from_internet_to_any_port(Check):
             report.status_extended = f"Security group {security_group.name} ({security_group.id}) has not all ports open to the Internet."
             report.resource_id = security_group.id
             report.resource_arn = security_group.arn
-            # Loop through every security group's ingress rule and check it
-            for ingress_rule in security_group.ingress_rules:
-                if check_security_group(ingress_rule, "-1", any_address=True):
-                    report.status = "FAIL"
-                    report.status_extended = f"Security group {security_group.name} ({security_group.id}) has all ports open to the Internet."
-                    break
+            if check_security_group_exposure(security_group, "-1", any_address=True):
+                report.status = "FAIL"
+                report.status_extended = f"Security group {security_group.name} ({security_group.id}) has all ports open to the Internet."
             findings.append(report)
 
         return findings
@@ -1,6 +1,8 @@
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.ec2.ec2_client import ec2_client
-from prowler.providers.aws.services.ec2.lib.security_groups import check_security_group
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    check_security_group_exposure,
+)
 
 
 class ec2_securitygroup_default_restrict_traffic(Check):
@@ -15,11 +17,11 @@ class ec2_securitygroup_default_restrict_traffic(Check):
             if security_group.name == "default":
                 report.status = "PASS"
                 report.status_extended = f"Default Security Group ({security_group.id}) is not open to the Internet."
-                for ingress_rule in security_group.ingress_rules:
-                    if check_security_group(ingress_rule, "-1", any_address=True):
-                        report.status = "FAIL"
-                        report.status_extended = f"Default Security Group ({security_group.id}) is open to the Internet."
-                        break
+                if check_security_group_exposure(
+                    security_group, "-1", any_address=True
+                ):
+                    report.status = "FAIL"
+                    report.status_extended = f"Default Security Group ({security_group.id}) is open to the Internet."
                 findings.append(report)
 
         return findings
@@ -1,11 +1,96 @@
 import threading
 from dataclasses import dataclass
+from typing import Any
 
 from botocore.client import ClientError
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import intern_string
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import get_checks_attributes
+from prowler.providers.aws.services.ec2.lib.network_acls import (
+    compact_network_acl_entries,
+)
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    compact_security_group_rules,
+)
+
+# Attributes read by each check, only these are collected for the checks to execute
+checks_attributes = {
+    "ec2_ami_public": ["images"],
+    "ec2_ebs_default_encryption": ["ebs_encryption_by_default"],
+    "ec2_ebs_public_snapshot": ["snapshots", "snapshots.public"],
+    "ec2_ebs_snapshots_encrypted": ["snapshots"],
+    "ec2_ebs_volume_encryption": ["volumes"],
+    "ec2_elastic_ip_shodan": ["elastic_ips"],
+    "ec2_elastic_ip_unassgined": ["elastic_ips"],
+    "ec2_instance_imdsv2_enabled": ["instances"],
+    "ec2_instance_internet_facing_with_instance_profile": ["instances"],
+    "ec2_instance_managed_by_ssm": ["instances"],
+    "ec2_instance_older_than_specific_days": ["instances"],
+    "ec2_instance_profile_attached": ["instances"],
+    "ec2_instance_public_ip": ["instances"],
+    "ec2_instance_secrets_user_data": ["instances", "instances.user_data"],
+    "ec2_networkacl_allow_ingress_any_port": ["network_acls"],
+    "ec2_networkacl_allow_ingress_tcp_port_22": ["network_acls"],
+    "ec2_networkacl_allow_ingress_tcp_port_3389": ["network_acls"],
+    "ec2_securitygroup_allow_ingress_from_internet_to_any_port": ["security_groups"],
+    "ec2_securitygroup_allow_ingress_from_internet_to_port_mongodb_27017_27018": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_ftp_port_20_21": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_22": ["security_groups"],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_3389": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_cassandra_7199_9160_8888": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_elasticsearch_kibana_9200_9300_5601": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_kafka_9092": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_memcached_11211": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_mysql_3306": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_oracle_1521_2483": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_postgres_5432": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_redis_6379": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_sql_server_1433_1434": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_ingress_from_internet_to_tcp_port_telnet_23": [
+        "security_groups"
+    ],
+    "ec2_securitygroup_allow_wide_open_public_ipv4": ["security_groups"],
+    "ec2_securitygroup_default_restrict_traffic": ["security_groups"],
+    "ec2_securitygroup_from_launch_wizard": ["security_groups"],
+    "ec2_securitygroup_in_use_without_ingress_filtering": [
+        "security_groups",
+        "security_groups.network_interfaces",
+    ],
+    "ec2_securitygroup_not_used": [
+        "security_groups",
+        "security_groups.network_interfaces",
+    ],
+    "ec2_securitygroup_with_many_ingress_egress_rules": ["security_groups"],
+    "emr_cluster_publicly_accesible": ["security_groups"],
+    "shield_advanced_protection_in_associated_elastic_ips": ["elastic_ips"],
+}
 
 
 ################## EC2
@@ -17,25 +102,37 @@ class EC2:
         self.audited_account = audit_info.audited_account
         self.audit_resources = audit_info.audit_resources
         self.regional_clients = generate_regional_clients(self.service, audit_info)
+        attributes = get_checks_attributes(audit_info, checks_attributes)
         self.instances = []
-        self.__threading_call__(self.__describe_instances__)
-        self.__get_instance_user_data__()
+        if "instances" in attributes:
+            self.__threading_call__(self.__describe_instances__)
+        if "instances.user_data" in attributes:
+            self.__get_instance_user_data__()
         self.security_groups = []
-        self.__threading_call__(self.__describe_security_groups__)
+        if "security_groups" in attributes:
+            self.__threading_call__(self.__describe_security_groups__)
         self.network_acls = []
-        self.__threading_call__(self.__describe_network_acls__)
+        if "network_acls" in attributes:
+            self.__threading_call__(self.__describe_network_acls__)
         self.snapshots = []
-        self.__threading_call__(self.__describe_snapshots__)
-        self.__get_snapshot_public__()
-        self.__threading_call__(self.__describe_network_interfaces__)
+        if "snapshots" in attributes:
+            self.__threading_call__(self.__describe_snapshots__)
+        if "snapshots.public" in attributes:
+            self.__get_snapshot_public__()
+        if "security_groups.network_interfaces" in attributes:
+            self.__threading_call__(self.__describe_network_interfaces__)
         self.images = []
-        self.__threading_call__(self.__describe_images__)
+        if "images" in attributes:
+            self.__threading_call__(self.__describe_images__)
         self.volumes = []
-        self.__threading_call__(self.__describe_volumes__)
+        if "volumes" in attributes:
+            self.__threading_call__(self.__describe_volumes__)
         self.ebs_encryption_by_default = []
-        self.__threading_call__(self.__get_ebs_encryption_by_default__)
+        if "ebs_encryption_by_default" in attributes:
+            self.__threading_call__(self.__get_ebs_encryption_by_default__)
         self.elastic_ips = []
-        self.__threading_call__(self.__describe_addresses__)
+        if "elastic_ips" in attributes:
+            self.__threading_call__(self.__describe_addresses__)
 
     def __get_session__(self):
         return self.session
@@ -125,8 +222,8 @@ class EC2:
                                 arn,
                                 regional_client.region,
                                 sg["GroupId"],
-                                sg["IpPermissions"],
-                                sg["IpPermissionsEgress"],
+                                compact_security_group_rules(sg["IpPermissions"]),
+                                compact_security_group_rules(sg["IpPermissionsEgress"]),
                             )
                         )
         except Exception as error:
@@ -151,7 +248,7 @@ class EC2:
                                 nacl["NetworkAclId"],
                                 arn,
                                 regional_client.region,
-                                nacl["Entries"],
+                                compact_network_acl_entries(nacl["Entries"]),
                             )
                         )
         except Exception as error:
@@ -367,6 +464,24 @@ class Instance:
     http_endpoint: str
     instance_profile: str
 
+    __slots__ = (
+        "id",
+        "arn",
+        "state",
+        "region",
+        "type",
+        "image_id",
+        "launch_time",
+        "private_dns",
+        "private_ip",
+        "public_dns",
+        "public_ip",
+        "user_data",
+        "http_tokens",
+        "http_endpoint",
+        "instance_profile",
+    )
+
     def __init__(
         self,
         id,
@@ -386,17 +501,17 @@ class Instance:
     ):
         self.id = id
         self.arn = arn
-        self.state = state
-        self.region = region
-        self.type = type
-        self.image_id = image_id
+        self.state = intern_string(state)
+        self.region = intern_string(region)
+        self.type = intern_string(type)
+        self.image_id = intern_string(image_id)
         self.launch_time = launch_time
         self.private_dns = private_dns
         self.private_ip = private_ip
         self.public_dns = public_dns
         self.public_ip = public_ip
-        self.http_tokens = http_tokens
-        self.http_endpoint = http_endpoint
+        self.http_tokens = intern_string(http_tokens)
+        self.http_endpoint = intern_string(http_endpoint)
         self.user_data = None
         self.instance_profile = instance_profile
 
@@ -409,10 +524,12 @@ class Snapshot:
     encrypted: bool
     public: bool
 
+    __slots__ = ("id", "arn", "region", "encrypted", "public")
+
     def __init__(self, id, arn, region, encrypted):
         self.id = id
         self.arn = arn
-        self.region = region
+        self.region = intern_string(region)
         self.encrypted = encrypted
         self.public = False
 
@@ -424,10 +541,12 @@ class Volume:
     region: str
     encrypted: bool
 
+    __slots__ = ("id", "arn", "region", "encrypted")
+
     def __init__(self, id, arn, region, encrypted):
         self.id = id
         self.arn = arn
-        self.region = region
+        self.region = intern_string(region)
         self.encrypted = encrypted
 
 
@@ -440,15 +559,29 @@ class SecurityGroup:
     network_interfaces: list[str]
     ingress_rules: list[dict]
     egress_rules: list[dict]
+    exposure: dict
+
+    __slots__ = (
+        "name",
+        "arn",
+        "region",
+        "id",
+        "network_interfaces",
+        "ingress_rules",
+        "egress_rules",
+        "exposure",
+    )
 
     def __init__(self, name, arn, region, id, ingress_rules, egress_rules):
         self.name = name
         self.arn = arn
-        self.region = region
+        self.region = intern_string(region)
         self.id = id
         self.ingress_rules = ingress_rules
         self.egress_rules = egress_rules
         self.network_interfaces = []
+        # Public ingress exposure per address matching mode, built on demand by the checks
+        self.exposure = {}
 
 
 @dataclass
@@ -457,12 +590,17 @@ class NetworkACL:
     arn: str
     region: str
     entries: list[dict]
+    compiled_entries: Any
+
+    __slots__ = ("id", "arn", "region", "entries", "compiled_entries")
 
     def __init__(self, id, arn, region, entries):
         self.id = id
         self.arn = arn
-        self.region = region
+        self.region = intern_string(region)
         self.entries = entries
+        # Public ingress entries compiled on demand by the checks
+        self.compiled_entries = None
 
 
 @dataclass
@@ -473,12 +611,14 @@ class ElasticIP:
     allocation_id: str
     region: str
 
+    __slots__ = ("public_ip", "association_id", "arn", "allocation_id", "region")
+
     def __init__(self, public_ip, association_id, allocation_id, arn, region):
         self.public_ip = public_ip
         self.association_id = association_id
         self.allocation_id = allocation_id
         self.arn = arn
-        self.region = region
+        self.region = intern_string(region)
 
 
 @dataclass
@@ -489,12 +629,14 @@ class Image:
     public: bool
     region: str
 
+    __slots__ = ("id", "arn", "name", "public", "region")
+
     def __init__(self, id, arn, name, public, region):
         self.id = id
         self.arn = arn
         self.name = name
         self.public = public
-        self.region = region
+        self.region = intern_string(region)
 
 
 @dataclass
@@ -502,6 +644,8 @@ class EbsEncryptionByDefault:
     status: bool
     region: str
 
+    __slots__ = ("status", "region")
+
     def __init__(self, status, region):
         self.status = status
-        self.region = region
+        self.region = intern_string(region)
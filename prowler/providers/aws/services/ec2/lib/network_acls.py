@@ -1,84 +1,147 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import Any
 
+from prowler.lib.utils.utils import intern_string
+
+public_IPv4 = "0.0.0.0/0"
+public_IPv6 = "::/0"
+
 
 # Network ACLs
-# Check if the network acls rules has ingress public access to the check_ports using the protocol
-def check_network_acl(rules: Any, protocol: str, port: str) -> bool:
+@dataclass
+class Compiled_Network_ACL:
+    """
+    Compiled_Network_ACL holds the public ingress entries of a Network ACL already evaluated in RuleNumber order.
 
-    # Spliting IPv6 from IPv4 rules
-    rules_IPv6 = list(
-        filter(lambda rule: rule.get("CidrBlock") is None and not rule["Egress"], rules)
-    )
+    For each address family and protocol there are sorted port segment starts and the action of the first
+    entry matching each segment ("allow", "deny" or None if no entry matches).
+    """
 
-    # For IPv6
-    # Rules must order by RuleNumber
-    for rule in sorted(rules_IPv6, key=lambda rule: rule["RuleNumber"]):
-        if (
-            rule["Ipv6CidrBlock"] == "::/0"
-            and rule["RuleAction"] == "deny"
-            and (
-                rule["Protocol"] == "-1"
-                or (
-                    rule["Protocol"] == protocol
-                    and rule["PortRange"]["From"] <= port <= rule["PortRange"]["To"]
-                )
-            )
-        ):
-            # Exist IPv6 deny for this port
-            break
-
-        if (
-            rule["Ipv6CidrBlock"] == "::/0"
-            and rule["RuleAction"] == "allow"
-            and (
-                rule["Protocol"] == "-1"
-                or (
-                    rule["Protocol"] == protocol
-                    and rule["PortRange"]["From"] <= port <= rule["PortRange"]["To"]
+    ipv4: dict = field(default_factory=dict)
+    ipv6: dict = field(default_factory=dict)
+
+
+def __compile_network_acl_family__(rules: list, protocol: str) -> tuple:
+    """__compile_network_acl_family__ returns the first-match-wins port segments of the ordered rules for the protocol"""
+    port_ranges = []
+    for rule in rules:
+        if rule["Protocol"] == "-1":
+            port_ranges.append((float("-inf"), float("inf"), rule["RuleAction"]))
+        elif rule["Protocol"] == protocol:
+            # Entries of protocols without ports cover the whole protocol
+            if "PortRange" in rule:
+                port_ranges.append(
+                    (
+                        rule["PortRange"]["From"],
+                        rule["PortRange"]["To"],
+                        rule["RuleAction"],
+                    )
                 )
+            else:
+                port_ranges.append((float("-inf"), float("inf"), rule["RuleAction"]))
+
+    boundaries = set()
+    for from_port, to_port, _ in port_ranges:
+        boundaries.add(from_port)
+        boundaries.add(to_port + 1)
+    segments_starts = []
+    segments_actions = []
+    for segment_start in sorted(boundaries):
+        action = None
+        for from_port, to_port, rule_action in port_ranges:
+            if from_port <= segment_start <= to_port:
+                action = rule_action
+                break
+        # Contiguous segments with the same action are merged
+        if not segments_actions or segments_actions[-1] != action:
+            segments_starts.append(segment_start)
+            segments_actions.append(action)
+    return segments_starts, segments_actions
+
+
+def compile_network_acl(rules: Any) -> Compiled_Network_ACL:
+    """compile_network_acl sorts and filters the public ingress entries once and compiles them per address family and protocol"""
+    compiled_network_acl = Compiled_Network_ACL()
+    ingress_rules = sorted(
+        (rule for rule in rules if not rule["Egress"]),
+        key=lambda rule: rule["RuleNumber"],
+    )
+    rules_IPv4 = [
+        rule
+        for rule in ingress_rules
+        if rule.get("Ipv6CidrBlock") is None and rule["CidrBlock"] == public_IPv4
+    ]
+    rules_IPv6 = [
+        rule
+        for rule in ingress_rules
+        if rule.get("CidrBlock") is None and rule["Ipv6CidrBlock"] == public_IPv6
+    ]
+    for family_rules, compiled_family in (
+        (rules_IPv4, compiled_network_acl.ipv4),
+        (rules_IPv6, compiled_network_acl.ipv6),
+    ):
+        # All traffic entries apply to every protocol, "-1" also holds the protocols without entries
+        for protocol in {"-1"} | {rule["Protocol"] for rule in family_rules}:
+            compiled_family[protocol] = __compile_network_acl_family__(
+                family_rules, protocol
             )
-        ):
-            # Exist IPv6 allow for this port
-            return True
+    return compiled_network_acl
 
-    # There are not IPv6 Public access here
 
-    # Spliting IPv4 from IPv6 rules
-    rules_IPv4 = list(
-        filter(
-            lambda rule: rule.get("Ipv6CidrBlock") is None and not rule["Egress"], rules
-        )
+def __get_network_acl_action__(compiled_family: dict, protocol: str, port: int):
+    """__get_network_acl_action__ returns the action of the first entry matching the port, or None"""
+    segments_starts, segments_actions = compiled_family.get(
+        protocol, compiled_family["-1"]
+    )
+    index = bisect_right(segments_starts, port) - 1
+    if index < 0:
+        return None
+    return segments_actions[index]
+
+
+def check_compiled_network_acl(
+    compiled_network_acl: Compiled_Network_ACL, protocol: str, port: int
+) -> bool:
+    """check_compiled_network_acl returns True if the port is reachable from the Internet using the protocol"""
+    # An IPv6 deny falls back to the IPv4 entries, an IPv4 deny denies the access
+    return (
+        __get_network_acl_action__(compiled_network_acl.ipv6, protocol, port) == "allow"
+        or __get_network_acl_action__(compiled_network_acl.ipv4, protocol, port)
+        == "allow"
     )
 
-    # For IPv4
-    # Rules must order by RuleNumber
-    for rule in sorted(rules_IPv4, key=lambda rule: rule["RuleNumber"]):
-        if (
-            rule["CidrBlock"] == "0.0.0.0/0"
-            and rule["RuleAction"] == "deny"
-            and (
-                rule["Protocol"] == "-1"
-                or (
-                    rule["Protocol"] == protocol
-                    and rule["PortRange"]["From"] <= port <= rule["PortRange"]["To"]
-                )
-            )
-        ):
-
-            # Exist IPv4 deny for this port and if exist IPv6 there are not IPv6 Public access here
-            return False
-
-        if (
-            rule["CidrBlock"] == "0.0.0.0/0"
-            and rule["RuleAction"] == "allow"
-            and (
-                rule["Protocol"] == "-1"
-                or (
-                    rule["Protocol"] == protocol
-                    and rule["PortRange"]["From"] <= port <= rule["PortRange"]["To"]
-                )
-            )
-        ):
-            return True
 
-    return False
+def check_network_acl_exposure(network_acl: Any, protocol: str, port: int) -> bool:
+    """check_network_acl_exposure compiles the Network ACL entries only once and checks if the port is reachable from the Internet using the protocol"""
+    if network_acl.compiled_entries is None:
+        network_acl.compiled_entries = compile_network_acl(network_acl.entries)
+    return check_compiled_network_acl(network_acl.compiled_entries, protocol, port)
+
+
+def compact_network_acl_entries(entries: list) -> list:
+    """compact_network_acl_entries keeps only the Network ACL entries fields read by the checks, with the repeated values interned"""
+    compact_entries = []
+    for entry in entries:
+        compact_entry = {
+            "Egress": entry["Egress"],
+            "RuleNumber": entry["RuleNumber"],
+            "Protocol": intern_string(entry["Protocol"]),
+            "RuleAction": intern_string(entry["RuleAction"]),
+        }
+        if "CidrBlock" in entry:
+            compact_entry["CidrBlock"] = intern_string(entry["CidrBlock"])
+        if "Ipv6CidrBlock" in entry:
+            compact_entry["Ipv6CidrBlock"] = intern_string(entry["Ipv6CidrBlock"])
+        if "PortRange" in entry:
+            compact_entry["PortRange"] = {
+                "From": entry["PortRange"]["From"],
+                "To": entry["PortRange"]["To"],
+            }
+        compact_entries.append(compact_entry)
+    return compact_entries
+
+
+# Check if the network acls rules has ingress public access to the check_ports using the protocol
+def check_network_acl(rules: Any, protocol: str, port: str) -> bool:
+    return check_compiled_network_acl(compile_network_acl(rules), protocol, port)
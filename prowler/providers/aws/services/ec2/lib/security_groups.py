@@ -1,6 +1,11 @@
 import ipaddress
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+from prowler.lib.utils.utils import intern_string
+
 
 ################## Security Groups
 def check_security_group(
@@ -90,6 +95,118 @@ def check_security_group(
     return False
 
 
+@dataclass
+class Security_Group_Exposure:
+    """
+    Security_Group_Exposure is the public ingress of a security group for one address matching mode
+
+    @param all_traffic: True if an all traffic ingress rule is public
+
+    @param any_port: True if an ingress rule with ports is public, regardless of its protocol
+
+    @param port_ranges: Merged public port ranges per protocol, as (sorted FromPorts, ToPorts)
+    """
+
+    all_traffic: bool = False
+    any_port: bool = False
+    port_ranges: dict = field(default_factory=dict)
+
+
+def get_security_group_exposure(
+    ingress_rules: list, any_address: bool = False
+) -> Security_Group_Exposure:
+    """
+    Build the exposure of the security group ingress rules, with the same semantics as check_security_group
+
+    @param ingress_rules: AWS Security Group IpPermissions Ingress Rules
+
+    @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
+    """
+    exposure = Security_Group_Exposure()
+    public_port_ranges = {}
+    for ingress_rule in ingress_rules:
+        if ingress_rule["IpProtocol"] == "-1" and (
+            any(
+                _is_cidr_public(ip_ingress_rule["CidrIp"], any_address)
+                for ip_ingress_rule in ingress_rule["IpRanges"]
+            )
+            or any(
+                _is_cidr_public(ip_ingress_rule["CidrIpv6"], any_address)
+                for ip_ingress_rule in ingress_rule["Ipv6Ranges"]
+            )
+        ):
+            exposure.all_traffic = True
+
+        # IPv6 ranges of the rules with ports are always checked for global addresses, as check_security_group does
+        if "FromPort" in ingress_rule and (
+            any(
+                _is_cidr_public(ip_ingress_rule["CidrIp"], any_address)
+                for ip_ingress_rule in ingress_rule["IpRanges"]
+            )
+            or any(
+                _is_cidr_public(ip_ingress_rule["CidrIpv6"])
+                for ip_ingress_rule in ingress_rule["Ipv6Ranges"]
+            )
+        ):
+            exposure.any_port = True
+            public_port_ranges.setdefault(ingress_rule["IpProtocol"], []).append(
+                (int(ingress_rule["FromPort"]), int(ingress_rule["ToPort"]))
+            )
+
+    for protocol, port_ranges in public_port_ranges.items():
+        from_ports = []
+        to_ports = []
+        for from_port, to_port in sorted(port_ranges):
+            if to_port < from_port:
+                continue
+            if from_ports and from_port <= to_ports[-1] + 1:
+                to_ports[-1] = max(to_ports[-1], to_port)
+            else:
+                from_ports.append(from_port)
+                to_ports.append(to_port)
+        exposure.port_ranges[protocol] = (from_ports, to_ports)
+
+    return exposure
+
+
+def check_security_group_exposure(
+    security_group: Any, protocol: str, ports: list = [], any_address: bool = False
+) -> bool:
+    """
+    Check if any of the security group ingress rules has public access to the ports using the protocol.
+
+    It returns the same as calling check_security_group for every ingress rule, but the exposure of the
+    security group is built once per address matching mode and shared by all the checks.
+
+    @param security_group: EC2 SecurityGroup
+
+    @param procotol: Protocol to check.
+
+    @param ports: List of ports to check. (Default: [])
+
+    @param any_address: If True, only 0.0.0.0/0 will be public and do not search for public addresses. (Default: False)
+    """
+    exposure = security_group.exposure.get(any_address)
+    if exposure is None:
+        exposure = get_security_group_exposure(
+            security_group.ingress_rules, any_address
+        )
+        security_group.exposure[any_address] = exposure
+
+    if exposure.all_traffic:
+        return True
+    if not ports:
+        return exposure.any_port
+    if protocol in exposure.port_ranges:
+        from_ports, to_ports = exposure.port_ranges[protocol]
+        for port in ports:
+            index = bisect_right(from_ports, port) - 1
+            if index >= 0 and port <= to_ports[index]:
+                return True
+    return False
+
+
+@lru_cache(maxsize=None)
 def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
     """
     Check if an input CIDR is public
@@ -107,3 +224,26 @@ def _is_cidr_public(cidr: str, any_address: bool = False) -> bool:
         return True
     if not any_address:
         return ipaddress.ip_network(cidr).is_global
+
+
+def compact_security_group_rules(rules: list) -> list:
+    """compact_security_group_rules keeps only the IpPermissions fields read by the checks, with the repeated values interned"""
+    compact_rules = []
+    for rule in rules:
+        compact_rule = {
+            "IpProtocol": intern_string(rule["IpProtocol"]),
+            "IpRanges": [
+                {"CidrIp": intern_string(ip_range["CidrIp"])}
+                for ip_range in rule.get("IpRanges", [])
+            ],
+            "Ipv6Ranges": [
+                {"CidrIpv6": intern_string(ip_range["CidrIpv6"])}
+                for ip_range in rule.get("Ipv6Ranges", [])
+            ],
+        }
+        if "FromPort" in rule:
+            compact_rule["FromPort"] = rule["FromPort"]
+        if "ToPort" in rule:
+            compact_rule["ToPort"] = rule["ToPort"]
+        compact_rules.append(compact_rule)
+    return compact_rules
@@ -1,9 +1,18 @@
 import csv
+import io
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 
+from prowler.config.config import (
+    credential_report_initial_backoff,
+    credential_report_max_backoff,
+    credential_report_max_wait,
+)
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import intern_string
 from prowler.providers.aws.aws_provider import generate_regional_clients
 
 
@@ -24,6 +33,19 @@ def is_service_role(role):
     return False
 
 
+def start_credential_report_generation(audit_info):
+    """start_credential_report_generation starts the credential report generation as soon as the audit session exists"""
+    try:
+        global_client = generate_regional_clients(
+            "iam", audit_info, global_service=True
+        )
+        list(global_client.values())[0].generate_credential_report()
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
 ################## IAM
 class IAM:
     def __init__(self, audit_info):
@@ -38,11 +60,16 @@ class IAM:
         )
         self.client = list(global_client.values())[0]
         self.region = self.client.region
+        # The credential report is generated in the background while the rest of IAM is gathered
+        self.__credential_report__ = []
+        self.__credential_report_thread__ = threading.Thread(
+            target=self.__get_credential_report__, daemon=True
+        )
+        self.__credential_report_thread__.start()
         self.users = self.__get_users__()
         self.roles = self.__get_roles__()
         self.account_summary = self.__get_account_summary__()
         self.virtual_mfa_devices = self.__list_virtual_mfa_devices__()
-        self.credential_report = self.__get_credential_report__()
         self.groups = self.__get_groups__()
         self.__get_group_users__()
         self.__list_attached_group_policies__()
@@ -87,24 +114,40 @@ class IAM:
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    @property
+    def credential_report(self):
+        """credential_report waits for the background credential report only when it is read"""
+        self.__credential_report_thread__.join()
+        return self.__credential_report__
+
+    @credential_report.setter
+    def credential_report(self, credential_report):
+        self.__credential_report_thread__.join()
+        self.__credential_report__ = credential_report
+
     def __get_credential_report__(self):
-        report_is_completed = False
         try:
-            while not report_is_completed:
-                report_status = self.client.generate_credential_report()
-                if report_status["State"] == "COMPLETE":
-                    report_is_completed = True
-            # Convert credential report to list of dictionaries
-            credential = self.client.get_credential_report()["Content"].decode("utf-8")
-            credential_lines = credential.split("\n")
-            csv_reader = csv.DictReader(credential_lines, delimiter=",")
-            credential_list = list(csv_reader)
-            return credential_list
+            backoff = credential_report_initial_backoff
+            waited = 0
+            # Poll with exponential backoff until the report generation is completed
+            while self.client.generate_credential_report()["State"] != "COMPLETE":
+                if waited >= credential_report_max_wait:
+                    raise TimeoutError(
+                        f"Credential report not completed after {credential_report_max_wait} seconds"
+                    )
+                time.sleep(backoff)
+                waited += backoff
+                backoff = min(backoff * 2, credential_report_max_backoff)
+            # Parse the credential report as a stream of records
+            credential = io.TextIOWrapper(
+                io.BytesIO(self.client.get_credential_report()["Content"]),
+                encoding="utf-8",
+            )
+            self.__credential_report__ = list(csv.DictReader(credential, delimiter=","))
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-            return []
 
     def __get_groups__(self):
         try:
@@ -346,7 +389,14 @@ class IAM:
                     if not self.audit_resources or (
                         is_resource_filtered(policy["Arn"], self.audit_resources)
                     ):
-                        policies.append(policy)
+                        # Only the fields read by the checks are kept
+                        policies.append(
+                            {
+                                "Arn": policy["Arn"],
+                                "PolicyName": policy["PolicyName"],
+                                "DefaultVersionId": policy["DefaultVersionId"],
+                            }
+                        )
         except Exception as error:
             logger.error(
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
@@ -410,9 +460,11 @@ class MFADevice:
     serial_number: str
     type: str
 
+    __slots__ = ("serial_number", "type")
+
     def __init__(self, serial_number, type):
         self.serial_number = serial_number
-        self.type = type
+        self.type = intern_string(type)
 
 
 @dataclass
@@ -424,6 +476,15 @@ class User:
     attached_policies: list[dict]
     inline_policies: list[str]
 
+    __slots__ = (
+        "name",
+        "arn",
+        "mfa_devices",
+        "password_last_used",
+        "attached_policies",
+        "inline_policies",
+    )
+
     def __init__(self, name, arn, password_last_used):
         self.name = name
         self.arn = arn
@@ -440,6 +501,8 @@ class Role:
     assume_role_policy: dict
     is_service_role: bool
 
+    __slots__ = ("name", "arn", "assume_role_policy", "is_service_role")
+
     def __init__(self, name, arn, assume_role_policy, is_service_role):
         self.name = name
         self.arn = arn
@@ -454,6 +517,8 @@ class Group:
     attached_policies: list[dict]
     users: list[User]
 
+    __slots__ = ("name", "arn", "attached_policies", "users")
+
     def __init__(self, name, arn):
         self.name = name
         self.arn = arn
@@ -474,6 +539,19 @@ class PasswordPolicy:
     reuse_prevention: int
     hard_expiry: bool
 
+    __slots__ = (
+        "length",
+        "symbols",
+        "numbers",
+        "uppercase",
+        "lowercase",
+        "allow_change",
+        "expiration",
+        "max_age",
+        "reuse_prevention",
+        "hard_expiry",
+    )
+
     def __init__(
         self,
         length,
@@ -506,6 +584,8 @@ class Certificate:
     arn: str
     expiration: datetime
 
+    __slots__ = ("name", "id", "arn", "expiration")
+
     def __init__(self, name, id, arn, expiration):
         self.name = name
         self.id = id
@@ -1,10 +1,10 @@
 import threading
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel
-
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import intern_string
 from prowler.providers.aws.aws_provider import generate_regional_clients
 
 
@@ -169,14 +169,15 @@ class RDS:
             )
 
 
-class DBInstance(BaseModel):
+@dataclass
+class DBInstance:
     id: str
     endpoint: Optional[dict]
     engine: str
     status: str
     public: bool
     encrypted: bool
-    backup_retention_period: int = 0
+    backup_retention_period: int
     cloudwatch_logs: Optional[list]
     deletion_protection: bool
     auto_minor_version_upgrade: bool
@@ -184,16 +185,80 @@ class DBInstance(BaseModel):
     multi_az: bool
     region: str
 
+    __slots__ = (
+        "id",
+        "endpoint",
+        "engine",
+        "status",
+        "public",
+        "encrypted",
+        "backup_retention_period",
+        "cloudwatch_logs",
+        "deletion_protection",
+        "auto_minor_version_upgrade",
+        "enhanced_monitoring_arn",
+        "multi_az",
+        "region",
+    )
+
+    def __init__(
+        self,
+        id,
+        engine,
+        status,
+        public,
+        encrypted,
+        deletion_protection,
+        auto_minor_version_upgrade,
+        multi_az,
+        region,
+        endpoint=None,
+        backup_retention_period=0,
+        cloudwatch_logs=None,
+        enhanced_monitoring_arn=None,
+    ):
+        self.id = id
+        self.endpoint = endpoint
+        self.engine = intern_string(engine)
+        self.status = intern_string(status)
+        self.public = public
+        self.encrypted = encrypted
+        self.backup_retention_period = backup_retention_period or 0
+        self.cloudwatch_logs = cloudwatch_logs
+        self.deletion_protection = deletion_protection
+        self.auto_minor_version_upgrade = auto_minor_version_upgrade
+        self.enhanced_monitoring_arn = enhanced_monitoring_arn
+        self.multi_az = multi_az
+        self.region = intern_string(region)
+
 
-class DBSnapshot(BaseModel):
+@dataclass
+class DBSnapshot:
     id: str
     instance_id: str
-    public: bool = False
+    public: bool
     region: str
 
+    __slots__ = ("id", "instance_id", "public", "region")
+
+    def __init__(self, id, instance_id, region, public=False):
+        self.id = id
+        self.instance_id = instance_id
+        self.public = public
+        self.region = intern_string(region)
 
-class ClusterSnapshot(BaseModel):
+
+@dataclass
+class ClusterSnapshot:
     id: str
     cluster_id: str
-    public: bool = False
+    public: bool
     region: str
+
+    __slots__ = ("id", "cluster_id", "public", "region")
+
+    def __init__(self, id, cluster_id, region, public=False):
+        self.id = id
+        self.cluster_id = cluster_id
+        self.public = public
+        self.region = intern_string(region)
@@ -6,7 +6,23 @@ from botocore.client import ClientError
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.utils.utils import intern_string
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import get_checks_attributes
+
+# Bucket attributes read by each check, only these are collected for the checks to execute
+checks_attributes = {
+    "cloudtrail_logs_s3_bucket_access_logging_enabled": ["logging"],
+    "cloudtrail_logs_s3_bucket_is_not_publicly_accessible": ["acl_grantees"],
+    "s3_bucket_acl_prohibited": ["ownership"],
+    "s3_bucket_default_encryption": ["encryption"],
+    "s3_bucket_no_mfa_delete": ["versioning"],
+    "s3_bucket_object_versioning": ["versioning"],
+    "s3_bucket_policy_public_write_access": ["policy"],
+    "s3_bucket_public_access": ["acl_grantees", "policy", "public_access_block"],
+    "s3_bucket_secure_transport_policy": ["policy"],
+    "s3_bucket_server_access_logging_enabled": ["logging"],
+}
 
 
 ################## S3
@@ -20,13 +36,22 @@ class S3:
         self.audited_partition = audit_info.audited_partition
         self.regional_clients = generate_regional_clients(self.service, audit_info)
         self.buckets = self.__list_buckets__(audit_info)
-        self.__threading_call__(self.__get_bucket_versioning__)
-        self.__threading_call__(self.__get_bucket_logging__)
-        self.__threading_call__(self.__get_bucket_policy__)
-        self.__threading_call__(self.__get_bucket_acl__)
-        self.__threading_call__(self.__get_public_access_block__)
-        self.__threading_call__(self.__get_bucket_encryption__)
-        self.__threading_call__(self.__get_bucket_ownership_controls__)
+        attributes = get_checks_attributes(audit_info, checks_attributes)
+        # The mfa_delete attribute is also retrieved with the bucket versioning
+        if "versioning" in attributes:
+            self.__threading_call__(self.__get_bucket_versioning__)
+        if "logging" in attributes:
+            self.__threading_call__(self.__get_bucket_logging__)
+        if "policy" in attributes:
+            self.__threading_call__(self.__get_bucket_policy__)
+        if "acl_grantees" in attributes:
+            self.__threading_call__(self.__get_bucket_acl__)
+        if "public_access_block" in attributes:
+            self.__threading_call__(self.__get_public_access_block__)
+        if "encryption" in attributes:
+            self.__threading_call__(self.__get_bucket_encryption__)
+        if "ownership" in attributes:
+            self.__threading_call__(self.__get_bucket_ownership_controls__)
 
     def __get_session__(self):
         return self.session
@@ -107,13 +132,11 @@ class S3:
         logger.info("S3 - Get buckets encryption...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket.encryption = regional_client.get_bucket_encryption(
-                Bucket=bucket.name
-            )["ServerSideEncryptionConfiguration"]["Rules"][0][
-                "ApplyServerSideEncryptionByDefault"
-            ][
-                "SSEAlgorithm"
-            ]
+            bucket.encryption = intern_string(
+                regional_client.get_bucket_encryption(Bucket=bucket.name)[
+                    "ServerSideEncryptionConfiguration"
+                ]["Rules"][0]["ApplyServerSideEncryptionByDefault"]["SSEAlgorithm"]
+            )
         except Exception as error:
             if "ServerSideEncryptionConfigurationNotFoundError" in str(error):
                 bucket.encryption = None
@@ -191,7 +214,7 @@ class S3:
                 if "URI" in grant["Grantee"]:
                     grantee.URI = grant["Grantee"]["URI"]
                 if "Permission" in grant:
-                    grantee.permission = grant["Permission"]
+                    grantee.permission = intern_string(grant["Permission"])
                 grantees.append(grantee)
             bucket.acl_grantees = grantees
         except Exception as error:
@@ -228,9 +251,11 @@ class S3:
         logger.info("S3 - Get buckets ownership controls...")
         try:
             regional_client = self.regional_clients[bucket.region]
-            bucket.ownership = regional_client.get_bucket_ownership_controls(
-                Bucket=bucket.name
-            )["OwnershipControls"]["Rules"][0]["ObjectOwnership"]
+            bucket.ownership = intern_string(
+                regional_client.get_bucket_ownership_controls(Bucket=bucket.name)[
+                    "OwnershipControls"
+                ]["Rules"][0]["ObjectOwnership"]
+            )
         except Exception as error:
             if "OwnershipControlsNotFoundError" in str(error):
                 bucket.ownership = None
@@ -294,10 +319,12 @@ class ACL_Grantee:
     URI: str
     permission: str
 
+    __slots__ = ("display_name", "ID", "type", "URI", "permission")
+
     def __init__(self, type):
         self.display_name = None
         self.ID = None
-        self.type = type
+        self.type = intern_string(type)
         self.URI = None
         self.permission = None
 
@@ -309,6 +336,13 @@ class PublicAccessBlock:
     block_public_policy: bool
     restrict_public_buckets: bool
 
+    __slots__ = (
+        "block_public_acls",
+        "ignore_public_acls",
+        "block_public_policy",
+        "restrict_public_buckets",
+    )
+
     def __init__(self, configuration):
         self.block_public_acls = configuration["BlockPublicAcls"]
         self.ignore_public_acls = configuration["IgnorePublicAcls"]
@@ -331,6 +365,21 @@ class Bucket:
     ownership: str
     mfa_delete: bool
 
+    __slots__ = (
+        "name",
+        "arn",
+        "versioning",
+        "logging",
+        "public_access_block",
+        "acl_grantees",
+        "policy",
+        "encryption",
+        "region",
+        "logging_target_bucket",
+        "ownership",
+        "mfa_delete",
+    )
+
     def __init__(self, name, arn, region):
         self.name = name
         self.arn = arn
@@ -348,7 +397,7 @@ class Bucket:
         self.acl_grantees = []
         self.policy = {}
         self.encryption = None
-        self.region = region
+        self.region = intern_string(region)
         self.logging_target_bucket = None
         self.ownership = None
         self.mfa_delete = False
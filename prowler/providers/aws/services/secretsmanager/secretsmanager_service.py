@@ -1,60 +1,34 @@
-import threading
-
 from pydantic import BaseModel
 
-from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import AWS_Service, List_Operation
 
 
 ################## SecretsManager
-class SecretsManager:
-    def __init__(self, audit_info):
-        self.service = "secretsmanager"
-        self.session = audit_info.audit_session
-        self.audited_account = audit_info.audited_account
-        self.audit_resources = audit_info.audit_resources
-        self.regional_clients = generate_regional_clients(self.service, audit_info)
-        self.secrets = {}
-        self.__threading_call__(self.__list_secrets__)
-
-    def __get_session__(self):
-        return self.session
+class SecretsManager(AWS_Service):
+    list_operations = [
+        List_Operation(
+            operation="list_secrets",
+            result_key="SecretList",
+            attribute="secrets",
+            arn=lambda secret: secret["ARN"],
+            resource=lambda secret, region: Secret(
+                arn=secret["ARN"],
+                name=secret["Name"],
+                region=region,
+                rotation_enabled=secret.get("RotationEnabled", False),
+            ),
+            key=lambda secret: secret["Name"],
+            page_size=100,
+        )
+    ]
 
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-    def __list_secrets__(self, regional_client):
-        logger.info("SecretsManager - Listing Secrets...")
-        try:
-            list_secrets_paginator = regional_client.get_paginator("list_secrets")
-            for page in list_secrets_paginator.paginate():
-                for secret in page["SecretList"]:
-                    if not self.audit_resources or (
-                        is_resource_filtered(secret["ARN"], self.audit_resources)
-                    ):
-                        self.secrets[secret["Name"]] = Secret(
-                            arn=secret["ARN"],
-                            name=secret["Name"],
-                            region=regional_client.region,
-                        )
-                        if "RotationEnabled" in secret:
-                            self.secrets[secret["Name"]].rotation_enabled = secret[
-                                "RotationEnabled"
-                            ]
-
-        except Exception as error:
-            logger.error(
-                f"{regional_client.region} --"
-                f" {error.__class__.__name__}[{error.__traceback__.tb_lineno}]:"
-                f" {error}"
-            )
+    def __init__(self, audit_info):
+        super().__init__(
+            "secretsmanager",
+            audit_info,
+            generate_regional_clients("secretsmanager", audit_info),
+        )
 
 
 class Secret(BaseModel):
@@ -1,77 +1,50 @@
-import threading
 from json import loads
 
 from pydantic import BaseModel
 
-from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.aws_provider import generate_regional_clients
+from prowler.providers.aws.lib.service.service import (
+    AWS_Service,
+    Enrichment_Operation,
+    List_Operation,
+)
 
 
-################################ SNS
-class SNS:
-    def __init__(self, audit_info):
-        self.service = "sns"
-        self.session = audit_info.audit_session
-        self.audit_resources = audit_info.audit_resources
-        self.regional_clients = generate_regional_clients(self.service, audit_info)
-        self.topics = []
-        self.__threading_call__(self.__list_topics__)
-        self.__get_topic_attributes__(self.regional_clients)
-
-    def __get_session__(self):
-        return self.session
+def __enrich_topic__(topic, topic_attributes):
+    if "Policy" in topic_attributes["Attributes"]:
+        topic.policy = loads(topic_attributes["Attributes"]["Policy"])
+    if "KmsMasterKeyId" in topic_attributes["Attributes"]:
+        topic.kms_master_key_id = topic_attributes["Attributes"]["KmsMasterKeyId"]
 
-    def __threading_call__(self, call):
-        threads = []
-        for regional_client in self.regional_clients.values():
-            threads.append(threading.Thread(target=call, args=(regional_client,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
 
-    def __list_topics__(self, regional_client):
-        logger.info("SNS - listing topics...")
-        try:
-            list_topics_paginator = regional_client.get_paginator("list_topics")
-            for page in list_topics_paginator.paginate():
-                for topic_arn in page["Topics"]:
-                    if not self.audit_resources or (
-                        is_resource_filtered(
-                            topic_arn["TopicArn"], self.audit_resources
-                        )
-                    ):
-                        self.topics.append(
-                            Topic(
-                                name=topic_arn["TopicArn"].rsplit(":", 1)[1],
-                                arn=topic_arn["TopicArn"],
-                                region=regional_client.region,
-                            )
-                        )
-        except Exception as error:
-            logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+################################ SNS
+class SNS(AWS_Service):
+    list_operations = [
+        List_Operation(
+            operation="list_topics",
+            result_key="Topics",
+            attribute="topics",
+            arn=lambda topic: topic["TopicArn"],
+            resource=lambda topic, region: Topic(
+                name=topic["TopicArn"].rsplit(":", 1)[1],
+                arn=topic["TopicArn"],
+                region=region,
+            ),
+        )
+    ]
+    enrichment_operations = [
+        Enrichment_Operation(
+            operation="get_topic_attributes",
+            attribute="topics",
+            parameters=lambda topic: {"TopicArn": topic.arn},
+            enrich=__enrich_topic__,
+        )
+    ]
 
-    def __get_topic_attributes__(self, regional_clients):
-        logger.info("SNS - getting topic attributes...")
-        try:
-            for topic in self.topics:
-                regional_client = regional_clients[topic.region]
-                topic_attributes = regional_client.get_topic_attributes(
-                    TopicArn=topic.arn
-                )
-                if "Policy" in topic_attributes["Attributes"]:
-                    topic.policy = loads(topic_attributes["Attributes"]["Policy"])
-                if "KmsMasterKeyId" in topic_attributes["Attributes"]:
-                    topic.kms_master_key_id = topic_attributes["Attributes"][
-                        "KmsMasterKeyId"
-                    ]
-        except Exception as error:
-            logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-            )
+    def __init__(self, audit_info):
+        super().__init__(
+            "sns", audit_info, generate_regional_clients("sns", audit_info)
+        )
 
 
 class Topic(BaseModel):
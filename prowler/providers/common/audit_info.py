@@ -10,6 +10,7 @@ from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     generate_regional_clients,
+    get_enabled_regions,
 )
 from prowler.providers.aws.lib.arn.arn import arn_parsing
 from prowler.providers.aws.lib.audit_info.audit_info import current_audit_info
@@ -252,6 +253,10 @@ Caller Identity ARN: {Fore.YELLOW}[{audit_info.audited_identity_arn}]{Style.RESE
         else:
             current_audit_info.profile_region = "us-east-1"
 
+        # Discover once the enabled regions to skip the disabled opt-in regions in every service
+        logger.info("Discovering enabled regions ...")
+        current_audit_info.enabled_regions = get_enabled_regions(current_audit_info)
+
         if not arguments.get("only_logs"):
             self.print_audit_credentials(current_audit_info)
 
@@ -6,6 +6,10 @@ from os.path import isdir
 
 from prowler.config.config import change_config_var, output_file_timestamp
 from prowler.lib.logger import logger
+from prowler.lib.outputs.html import HTML_Compact_Report
+from prowler.providers.aws.lib.security_hub.security_hub_state import (
+    Security_Hub_State,
+)
 
 
 def set_provider_output_options(
@@ -72,13 +76,18 @@ class Azure_Output_Options(Provider_Output_Options):
         else:
             self.output_filename = arguments.output_filename
 
-        # Remove HTML Output since it is not supported yet
+        # Remove HTML Outputs since they are not supported yet
         if "html" in arguments.output_modes:
             arguments.output_modes.remove("html")
+        if "html-compact" in arguments.output_modes:
+            arguments.output_modes.remove("html-compact")
 
 
 class Aws_Output_Options(Provider_Output_Options):
     security_hub_enabled: bool
+    security_hub_findings_ids: dict
+    security_hub_state: Security_Hub_State
+    html_compact_report: HTML_Compact_Report
 
     def __init__(self, arguments, audit_info, allowlist_file, bulk_checks_metadata):
         # First call Provider_Output_Options init
@@ -99,8 +108,27 @@ class Aws_Output_Options(Provider_Output_Options):
         else:
             self.output_filename = arguments.output_filename
 
+        # Compact HTML Output state, kept while the findings are streamed
+        self.html_compact_report = None
+        if self.output_modes and "html-compact" in self.output_modes:
+            self.html_compact_report = HTML_Compact_Report(
+                self.output_filename, self.output_directory
+            )
+
         # Security Hub Outputs
         self.security_hub_enabled = arguments.security_hub
+        # ASFF Ids emitted by region, to archive the previous findings
+        self.security_hub_findings_ids = {}
+        # Local state of the findings sent to Security Hub to only send the delta
+        self.security_hub_state = None
+        if (
+            arguments.security_hub
+            and hasattr(arguments, "sh_state_file")
+            and arguments.sh_state_file
+        ):
+            self.security_hub_state = Security_Hub_State(
+                arguments.sh_state_file, arguments.sh_refresh_days
+            )
         if arguments.security_hub:
             if not self.output_modes:
                 self.output_modes = ["json-asff"]
@@ -1,20 +1,25 @@
 import os
 import pathlib
+import sys
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
+from types import ModuleType
 
 from mock import patch
 
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
+    get_check_service_clients,
     get_checks_from_input_arn,
+    get_execution_plan,
     get_regions_from_audit_resources,
     list_modules,
     list_services,
     parse_checks_from_file,
     recover_checks_from_provider,
     recover_checks_from_service,
+    release_service_client,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
@@ -434,3 +439,51 @@ class Test_Check:
         assert audit_metadata.services_scanned == 1
         assert audit_metadata.expected_checks == expected_checks
         assert audit_metadata.completed_checks == 1
+
+    def test_get_check_service_clients(self):
+        assert get_check_service_clients("emr_cluster_publicly_accesible", "aws") == {
+            "prowler.providers.aws.services.ec2.ec2_client",
+            "prowler.providers.aws.services.emr.emr_client",
+        }
+        assert get_check_service_clients("nonexistent_check", "aws") == set()
+
+    def test_get_execution_plan(self):
+        checks_to_execute = [
+            "ec2_ami_public",
+            "s3_bucket_object_versioning",
+            "emr_cluster_publicly_accesible",
+            "ec2_ebs_volume_encryption",
+        ]
+        execution_plan = get_execution_plan(checks_to_execute, "aws")
+        # Checks are grouped by service
+        assert list(execution_plan) == [
+            "ec2_ami_public",
+            "ec2_ebs_volume_encryption",
+            "s3_bucket_object_versioning",
+            "emr_cluster_publicly_accesible",
+        ]
+        assert execution_plan == {
+            "ec2_ami_public": [],
+            "ec2_ebs_volume_encryption": [],
+            "s3_bucket_object_versioning": [
+                "prowler.providers.aws.services.s3.s3_client"
+            ],
+            "emr_cluster_publicly_accesible": [
+                "prowler.providers.aws.services.ec2.ec2_client",
+                "prowler.providers.aws.services.emr.emr_client",
+            ],
+        }
+
+    def test_release_service_client(self):
+        class Test_Service:
+            def __init__(self):
+                self.resources = ["resource"]
+
+        client_module = ModuleType("prowler.providers.aws.services.test.test_client")
+        client_module.test_client = Test_Service()
+        client = client_module.test_client
+        sys.modules[client_module.__name__] = client_module
+
+        release_service_client(client_module.__name__)
+        assert client_module.__name__ not in sys.modules
+        assert not hasattr(client, "resources")
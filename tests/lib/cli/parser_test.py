@@ -744,6 +744,20 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.skip_sh_update
 
+    def test_aws_parser_sh_state_file(self):
+        argument = "--sh-state-file"
+        state_file = "prowler-securityhub-state.db"
+        command = [prowler_command, "-S", argument, state_file]
+        parsed = self.parser.parse(command)
+        assert parsed.sh_state_file == state_file
+        assert parsed.sh_refresh_days == 30
+
+    def test_aws_parser_sh_refresh_days(self):
+        argument = "--sh-refresh-days"
+        command = [prowler_command, "-S", argument, "7"]
+        parsed = self.parser.parse(command)
+        assert parsed.sh_refresh_days == 7
+
     def test_aws_parser_quick_inventory_short(self):
         argument = "-i"
         command = [prowler_command, argument]
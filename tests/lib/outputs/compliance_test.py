@@ -0,0 +1,154 @@
+from os import path
+
+from prowler.lib.check.compliance_models import (
+    CIS_Requirements,
+    Compliance_Base_Model,
+    Compliance_Requirement,
+    ENS_Requirements,
+)
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
+from prowler.lib.outputs.compliance import (
+    aggregate_compliance_tables,
+    build_compliance_tables_index,
+    get_compliance_table_type,
+)
+
+CHECK_ID = "iam_disable_30_days_credentials"
+
+CIS_1_4_AWS = Compliance_Base_Model(
+    Framework="CIS",
+    Provider="AWS",
+    Version="1.4",
+    Description="CIS",
+    Requirements=[
+        Compliance_Requirement(
+            Id="1.12",
+            Description="Ensure credentials unused for 45 days or greater are disabled",
+            Attributes=[
+                CIS_Requirements(
+                    Section="1. Identity and Access Management",
+                    Profile="Level 1",
+                    AssessmentStatus="Automated",
+                    Description="",
+                    RationaleStatement="",
+                    ImpactStatement="",
+                    RemediationProcedure="",
+                    AuditProcedure="",
+                    AdditionalInformation="",
+                    References="",
+                )
+            ],
+            Checks=[],
+        )
+    ],
+)
+
+ENS_RD2022_AWS = Compliance_Base_Model(
+    Framework="ENS",
+    Provider="AWS",
+    Version="RD2022",
+    Description="ENS",
+    Requirements=[
+        Compliance_Requirement(
+            Id="op.acc.1.aws.iam.2",
+            Description="Identificación",
+            Attributes=[
+                ENS_Requirements(
+                    IdGrupoControl="op.acc.1",
+                    Marco="operacional",
+                    Categoria="control de acceso",
+                    DescripcionControl="",
+                    Tipo="requisito",
+                    Nivel="alto",
+                    Dimensiones=["trazabilidad", "autenticidad"],
+                )
+            ],
+            Checks=[],
+        )
+    ],
+)
+
+
+def generate_bulk_checks_metadata():
+    check_metadata = load_check_metadata(
+        f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+    )
+    check_metadata.Compliance = [CIS_1_4_AWS, ENS_RD2022_AWS]
+    return {CHECK_ID: check_metadata}
+
+
+def generate_finding(bulk_checks_metadata, status):
+    finding = Check_Report_AWS(bulk_checks_metadata[CHECK_ID].json())
+    finding.status = status
+    finding.region = "eu-west-1"
+    finding.resource_id = "test-resource"
+    return finding
+
+
+class Test_Compliance_Tables:
+    def test_get_compliance_table_type(self):
+        assert get_compliance_table_type("ens_rd2022_aws") == "ens"
+        assert get_compliance_table_type("cis_1.4_aws") == "cis"
+        assert get_compliance_table_type("cis_1.5_aws") == "cis"
+        assert get_compliance_table_type("soc2_aws") is None
+
+    def test_build_compliance_tables_index(self):
+        bulk_checks_metadata = generate_bulk_checks_metadata()
+        index = build_compliance_tables_index(
+            bulk_checks_metadata, ["cis_1.4_aws", "cis_1.5_aws", "soc2_aws"]
+        )
+        assert list(index.keys()) == [CHECK_ID]
+        assert len(index[CHECK_ID]) == 1
+        assert index[CHECK_ID][0][0] == "cis_1.4_aws"
+        assert index[CHECK_ID][0][1].Framework == "CIS"
+
+    def test_build_compliance_tables_index_no_tables(self):
+        bulk_checks_metadata = generate_bulk_checks_metadata()
+        assert build_compliance_tables_index(bulk_checks_metadata, ["soc2_aws"]) == {}
+
+    def test_aggregate_compliance_tables(self):
+        bulk_checks_metadata = generate_bulk_checks_metadata()
+        findings = [
+            generate_finding(bulk_checks_metadata, "PASS"),
+            generate_finding(bulk_checks_metadata, "FAIL"),
+            generate_finding(bulk_checks_metadata, "PASS"),
+        ]
+        compliance_tables = aggregate_compliance_tables(
+            findings,
+            bulk_checks_metadata,
+            ["cis_1.4_aws", "ens_rd2022_aws", "cis_1.5_aws", "soc2_aws"],
+        )
+
+        assert sorted(compliance_tables.keys()) == [
+            "cis_1.4_aws",
+            "cis_1.5_aws",
+            "ens_rd2022_aws",
+        ]
+
+        cis = compliance_tables["cis_1.4_aws"]
+        assert cis["framework"] == "CIS"
+        assert cis["version"] == "1.4"
+        assert cis["pass_count"] == 2
+        assert cis["fail_count"] == 1
+        assert cis["groups"] == {
+            "1. Identity and Access Management": {
+                "Level 1": {"FAIL": 1, "PASS": 2},
+                "Level 2": {"FAIL": 0, "PASS": 0},
+            }
+        }
+
+        ens = compliance_tables["ens_rd2022_aws"]
+        assert ens["pass_count"] == 2
+        assert ens["fail_count"] == 1
+        assert ens["groups"]["operacional/control de acceso"] == {
+            "Estado": "NO CUMPLE",
+            "Opcional": 0,
+            "Alto": 3,
+            "Medio": 0,
+            "Bajo": 0,
+        }
+
+        # No findings for CIS 1.5
+        assert compliance_tables["cis_1.5_aws"]["pass_count"] == 0
+        assert compliance_tables["cis_1.5_aws"]["fail_count"] == 0
+        assert compliance_tables["cis_1.5_aws"]["groups"] == {}
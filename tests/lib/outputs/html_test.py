@@ -0,0 +1,112 @@
+from os import path, remove
+
+from prowler.config.config import html_compact_file_suffix
+from prowler.lib.check.models import Check_Report_AWS, load_check_metadata
+from prowler.lib.outputs.html import (
+    HTML_Compact_Report,
+    add_html_compact_footer,
+    fill_html_compact,
+    get_html_compact_page_name,
+    initialize_html_compact_page,
+    update_html_compact_statistics,
+)
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+
+AWS_ACCOUNT_ID = "123456789012"
+
+
+def set_mocked_audit_info():
+    return AWS_Audit_Info(
+        session_config=None,
+        original_session=None,
+        audit_session=None,
+        audited_account=AWS_ACCOUNT_ID,
+        audited_identity_arn="test-arn",
+        audited_user_id="test",
+        audited_partition="aws",
+        profile="default",
+        profile_region="eu-west-1",
+        credentials=None,
+        assumed_role_info=None,
+        audited_regions=["eu-west-2", "eu-west-1"],
+        organizations_metadata=None,
+        audit_resources=None,
+    )
+
+
+def generate_finding(status, resource_id):
+    finding = Check_Report_AWS(
+        load_check_metadata(
+            f"{path.dirname(path.realpath(__file__))}/fixtures/metadata.json"
+        ).json()
+    )
+    finding.status = status
+    finding.status_extended = "<script>alert(1)</script>"
+    finding.region = "eu-west-1"
+    finding.resource_id = resource_id
+    return finding
+
+
+class Test_HTML_Compact:
+    def test_get_html_compact_page_name(self):
+        assert get_html_compact_page_name("prowler-output", 1) == "prowler-output"
+        assert get_html_compact_page_name("prowler-output", 3) == "prowler-output_page3"
+
+    def test_update_html_compact_statistics(self):
+        html_compact_report = HTML_Compact_Report("test", "test")
+        update_html_compact_statistics(
+            html_compact_report, generate_finding("PASS", "a")
+        )
+        update_html_compact_statistics(
+            html_compact_report, generate_finding("FAIL", "a")
+        )
+        update_html_compact_statistics(
+            html_compact_report, generate_finding("INFO", "b")
+        )
+        assert html_compact_report.total_pass == 1
+        assert html_compact_report.total_fail == 1
+        assert html_compact_report.findings_count == 2
+        assert html_compact_report.resources == {"a", "b"}
+
+    def test_fill_html_compact_pages(self):
+        output_directory = path.dirname(path.realpath(__file__))
+        audit_info = set_mocked_audit_info()
+        html_compact_report = HTML_Compact_Report(
+            "test-html-compact", output_directory, max_findings_per_page=2
+        )
+        file_descriptor = initialize_html_compact_page(html_compact_report, audit_info)
+        for resource_id in ["a", "b", "c"]:
+            finding = generate_finding("FAIL", resource_id)
+            update_html_compact_statistics(html_compact_report, finding)
+            file_descriptor = fill_html_compact(
+                file_descriptor, html_compact_report, finding, audit_info
+            )
+        file_descriptor.close()
+        add_html_compact_footer(html_compact_report)
+
+        pages = [
+            f"{output_directory}/test-html-compact{html_compact_file_suffix}",
+            f"{output_directory}/test-html-compact_page2{html_compact_file_suffix}",
+        ]
+        assert html_compact_report.page == 2
+        page_contents = []
+        for page in pages:
+            with open(page) as file:
+                page_contents.append(file.read())
+            remove(page)
+
+        # Check metadata is written once per page
+        assert page_contents[0].count('C["') == 1
+        assert page_contents[0].count("F.push(") == 2
+        assert page_contents[1].count('C["') == 1
+        assert page_contents[1].count("F.push(") == 1
+        # The statistics of the whole report are appended to every page
+        for content in page_contents:
+            assert "TOTAL_FINDINGS" not in content
+            assert '"findings_count":3' in content
+            assert '"total_fail":3' in content
+            assert '"resources_count":3' in content
+            # Data cannot break out of the script block
+            assert "<script>alert(1)</script>" not in content
+            assert "\\u003cscript>alert(1)\\u003c/script>" in content
+        assert '"page":2' in page_contents[1]
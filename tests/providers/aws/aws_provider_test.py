@@ -1,11 +1,14 @@
+from unittest import mock
+
 import boto3
 import sure  # noqa
-from moto import mock_iam, mock_sts
+from moto import mock_ec2, mock_iam, mock_sts
 
 from prowler.providers.aws.aws_provider import (
     AWS_Provider,
     assume_role,
     generate_regional_clients,
+    get_enabled_regions,
 )
 from prowler.providers.aws.lib.audit_info.models import AWS_Assume_Role, AWS_Audit_Info
 
@@ -179,3 +182,70 @@ class Test_AWS_Provider:
 
         # Shield does not exist in China
         assert generate_regional_clients_response == {}
+
+    def test_generate_regional_clients_skips_disabled_regions(self):
+        session = boto3.session.Session(
+            region_name="us-east-1",
+        )
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session,
+            audited_account=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-1", "us-east-1", "ap-east-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+            enabled_regions={"eu-west-1", "us-east-1"},
+        )
+        generate_regional_clients_response = generate_regional_clients(
+            "ec2", audit_info
+        )
+
+        assert set(generate_regional_clients_response.keys()) == {
+            "eu-west-1",
+            "us-east-1",
+        }
+
+    @mock_ec2
+    def test_get_enabled_regions(self, tmp_path):
+        session = boto3.session.Session(
+            region_name="us-east-1",
+        )
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session,
+            audited_account=ACCOUNT_ID,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            audited_user_id=None,
+            profile=None,
+            profile_region="us-east-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+        with mock.patch(
+            "prowler.providers.aws.aws_provider.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            enabled_regions = get_enabled_regions(audit_info)
+            assert "us-east-1" in enabled_regions
+            # ap-east-1 is an opt-in region
+            assert "ap-east-1" not in enabled_regions
+            assert (
+                tmp_path / f"prowler-enabled-regions-aws-{ACCOUNT_ID}.json"
+            ).exists()
+
+            # The cached regions are used while they are not expired
+            audit_info.audit_session = None
+            assert get_enabled_regions(audit_info) == enabled_regions
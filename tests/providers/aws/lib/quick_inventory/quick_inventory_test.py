@@ -0,0 +1,146 @@
+import csv
+import json
+from os import listdir, remove
+
+import boto3
+from moto import mock_iam, mock_resourcegroupstaggingapi, mock_s3
+
+from prowler.config.config import csv_file_suffix, json_file_suffix
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.quick_inventory.quick_inventory import (
+    create_inventory_table,
+    parse_inventory_arn,
+    quick_inventory,
+)
+
+AWS_ACCOUNT_ID = "123456789012"
+
+
+class Test_Quick_Inventory:
+    def set_mocked_audit_info(self):
+        return AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=boto3.session.Session(
+                region_name="us-east-1",
+            ),
+            audited_account=AWS_ACCOUNT_ID,
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="us-east-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["us-east-1", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+
+    def test_parse_inventory_arn_s3(self):
+        resource, resource_type = parse_inventory_arn(
+            "arn:aws:s3:::test-bucket", AWS_ACCOUNT_ID
+        )
+        assert resource == {
+            "AWS_AccountID": AWS_ACCOUNT_ID,
+            "AWS_Region": "",
+            "AWS_Partition": "aws",
+            "AWS_Service": "s3",
+            "AWS_ResourceType": "bucket",
+            "AWS_ResourceID": "test-bucket",
+            "AWS_ResourceARN": "arn:aws:s3:::test-bucket",
+        }
+        assert resource_type == "bucket"
+
+    def test_parse_inventory_arn_with_path(self):
+        resource, resource_type = parse_inventory_arn(
+            f"arn:aws:iam::{AWS_ACCOUNT_ID}:role/path/test-role", AWS_ACCOUNT_ID
+        )
+        assert resource["AWS_Service"] == "iam"
+        assert resource["AWS_ResourceType"] == "role"
+        assert resource["AWS_ResourceID"] == "test-role"
+        assert resource_type == "role"
+
+    def test_parse_inventory_arn_with_colon(self):
+        resource, resource_type = parse_inventory_arn(
+            f"arn:aws:logs:eu-west-1:{AWS_ACCOUNT_ID}:log-group:test-group",
+            AWS_ACCOUNT_ID,
+        )
+        assert resource["AWS_Region"] == "eu-west-1"
+        assert resource["AWS_ResourceType"] == "log-group"
+        assert resource["AWS_ResourceID"] == "test-group"
+        assert resource_type == "log-group"
+
+    def test_parse_inventory_arn_sns(self):
+        resource, resource_type = parse_inventory_arn(
+            f"arn:aws:sns:eu-west-1:{AWS_ACCOUNT_ID}:test-topic", AWS_ACCOUNT_ID
+        )
+        assert resource["AWS_ResourceType"] == "test-topic"
+        assert resource["AWS_ResourceID"] == ""
+        assert resource_type == "topic"
+
+    def test_parse_inventory_arn_wafv2(self):
+        resource, resource_type = parse_inventory_arn(
+            f"arn:aws:wafv2:eu-west-1:{AWS_ACCOUNT_ID}:regional/webacl/test/1234",
+            AWS_ACCOUNT_ID,
+        )
+        assert resource["AWS_ResourceType"] == "regional/webacl"
+        assert resource["AWS_ResourceID"] == "test/1234"
+        assert resource_type == "regional"
+
+    def test_parse_inventory_arn_apigateway(self):
+        _, resource_type = parse_inventory_arn(
+            "arn:aws:apigateway:eu-west-1::/restapis/abc/documentation/parts/def",
+            AWS_ACCOUNT_ID,
+        )
+        assert resource_type == "restapis-documentation-parts"
+        _, resource_type = parse_inventory_arn(
+            "arn:aws:apigateway:eu-west-1::/restapis/abc", AWS_ACCOUNT_ID
+        )
+        assert resource_type == "restapis"
+
+    def test_create_inventory_table(self):
+        inventory_table = create_inventory_table(
+            {"s3": {"bucket": 2}, "iam": {"user": 1, "role": 3}}
+        )
+        assert inventory_table["Service"] == ["iam", "s3"]
+        assert "4" in inventory_table["Total"][0]
+        assert "2" in inventory_table["Total"][1]
+        assert inventory_table["Count per resource types"][0].startswith("role")
+
+    @mock_iam
+    @mock_s3
+    @mock_resourcegroupstaggingapi
+    def test_quick_inventory(self, tmp_path):
+        iam_client = boto3.client("iam")
+        iam_client.create_user(UserName="test-user")
+        s3_client = boto3.client("s3", region_name="eu-west-1")
+        s3_client.create_bucket(
+            Bucket="test-bucket",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        s3_client.put_bucket_tagging(
+            Bucket="test-bucket",
+            Tagging={"TagSet": [{"Key": "test", "Value": "test"}]},
+        )
+
+        quick_inventory(self.set_mocked_audit_info(), str(tmp_path))
+
+        output_files = listdir(tmp_path)
+        assert len(output_files) == 2
+        json_file = [file for file in output_files if file.endswith(json_file_suffix)]
+        csv_file = [file for file in output_files if file.endswith(csv_file_suffix)]
+        with open(f"{tmp_path}/{json_file[0]}") as file:
+            resources = json.load(file)
+        with open(f"{tmp_path}/{csv_file[0]}") as file:
+            rows = list(csv.DictReader(file))
+        remove(f"{tmp_path}/{json_file[0]}")
+        remove(f"{tmp_path}/{csv_file[0]}")
+
+        resources_arns = [resource["AWS_ResourceARN"] for resource in resources]
+        assert sorted(row["AWS_ResourceARN"] for row in rows) == sorted(resources_arns)
+        # IAM resources are only gathered once
+        assert (
+            resources_arns.count(f"arn:aws:iam::{AWS_ACCOUNT_ID}:user/test-user") == 1
+        )
+        assert "arn:aws:s3:::test-bucket" in resources_arns
@@ -0,0 +1,94 @@
+from unittest import mock
+
+import boto3
+from moto import mock_ec2
+
+from prowler.providers.aws.lib.rate_limiter.rate_limiter import (
+    Rate_Limiter,
+    attach_rate_limiter,
+    get_rate_limiter,
+    is_throttling_response,
+)
+
+AWS_REGION = "eu-west-1"
+
+
+class Test_Rate_Limiter:
+    def test_acquire_burst_and_wait(self):
+        rate_limiter = Rate_Limiter(2)
+        with mock.patch(
+            "prowler.providers.aws.lib.rate_limiter.rate_limiter.time.sleep"
+        ) as sleep, mock.patch(
+            "prowler.providers.aws.lib.rate_limiter.rate_limiter.time.monotonic",
+            return_value=rate_limiter.last_refill,
+        ):
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+            sleep.assert_not_called()
+            # The bucket is empty, the next requests are spaced by the rate
+            rate_limiter.acquire()
+            sleep.assert_called_with(0.5)
+            rate_limiter.acquire()
+            sleep.assert_called_with(1)
+
+    def test_on_throttle_and_on_success(self):
+        rate_limiter = Rate_Limiter(10)
+        rate_limiter.on_throttle()
+        assert rate_limiter.rate == 5
+        # Only one decrease per cooldown period
+        rate_limiter.on_throttle()
+        assert rate_limiter.rate == 5
+        rate_limiter.on_success()
+        assert rate_limiter.rate == 5.2
+        for _ in range(100):
+            rate_limiter.on_success()
+        assert rate_limiter.rate == 10
+
+    def test_get_rate_limiter(self):
+        with mock.patch(
+            "prowler.providers.aws.lib.rate_limiter.rate_limiter.rate_limits",
+            new={"default": 30, "test-service": 5},
+        ), mock.patch(
+            "prowler.providers.aws.lib.rate_limiter.rate_limiter.rate_limiters",
+            new={},
+        ):
+            rate_limiter = get_rate_limiter("test-service", AWS_REGION)
+            assert rate_limiter.max_rate == 5
+            assert get_rate_limiter("test-service", AWS_REGION) is rate_limiter
+            assert get_rate_limiter("test-service", "us-east-1") is not rate_limiter
+            assert get_rate_limiter("other-service", AWS_REGION).max_rate == 30
+
+    def test_is_throttling_response(self):
+        assert is_throttling_response((None, {"Error": {"Code": "Throttling"}}))
+        assert is_throttling_response(
+            (None, {"Error": {"Code": "RequestLimitExceeded"}})
+        )
+        assert not is_throttling_response((None, {"Error": {"Code": "AccessDenied"}}))
+        assert not is_throttling_response((None, {}))
+        assert not is_throttling_response(None)
+
+    @mock_ec2
+    def test_attach_rate_limiter(self):
+        rate_limiter = Rate_Limiter(10)
+        with mock.patch(
+            "prowler.providers.aws.lib.rate_limiter.rate_limiter.get_rate_limiter",
+            return_value=rate_limiter,
+        ):
+            client = boto3.client("ec2", region_name=AWS_REGION)
+            attach_rate_limiter(client, "ec2", AWS_REGION)
+        with mock.patch.object(
+            rate_limiter, "acquire", wraps=rate_limiter.acquire
+        ) as acquire:
+            client.describe_regions()
+            acquire.assert_called_once()
+        client.meta.events.emit(
+            "needs-retry.ec2.DescribeRegions",
+            response=(
+                mock.MagicMock(status_code=503),
+                {"Error": {"Code": "RequestLimitExceeded"}},
+            ),
+            attempts=1,
+            caught_exception=None,
+            request_dict={"context": {}},
+        )
+        assert rate_limiter.rate == 5
@@ -0,0 +1,79 @@
+from os import path, remove
+
+from prowler.lib.outputs.models import Check_Output_JSON_ASFF, Compliance
+from prowler.providers.aws.lib.security_hub.security_hub_state import (
+    Security_Hub_State,
+    hash_security_hub_finding,
+)
+
+STATE_FILE = f"{path.dirname(path.realpath(__file__))}/security_hub_state_test.db"
+
+
+def generate_finding_output(finding_id, status, description="test"):
+    finding_output = Check_Output_JSON_ASFF()
+    finding_output.Id = finding_id
+    finding_output.Description = description
+    finding_output.UpdatedAt = "2023-01-01T00:00:00Z"
+    finding_output.Compliance = Compliance(Status=status, RelatedRequirements=[])
+    return finding_output
+
+
+class Test_Security_Hub_State:
+    def teardown_method(self):
+        for suffix in ["", "-wal", "-shm"]:
+            if path.isfile(f"{STATE_FILE}{suffix}"):
+                remove(f"{STATE_FILE}{suffix}")
+
+    def test_hash_security_hub_finding_ignores_timestamps(self):
+        finding_output = generate_finding_output("test-id", "FAILED")
+        finding_hash = hash_security_hub_finding(finding_output)
+        finding_output.UpdatedAt = "2023-02-01T00:00:00Z"
+        assert hash_security_hub_finding(finding_output) == finding_hash
+        finding_output.Description = "changed"
+        assert hash_security_hub_finding(finding_output) != finding_hash
+
+    def test_needs_update(self):
+        state = Security_Hub_State(STATE_FILE)
+        finding_output = generate_finding_output("test-id", "FAILED")
+        # New finding
+        assert state.needs_update(finding_output)
+        state.update(finding_output, "eu-west-1")
+        state.close()
+
+        # Next execution
+        state = Security_Hub_State(STATE_FILE)
+        state.execution_time += 3600
+        # Unchanged finding
+        assert not state.needs_update(finding_output)
+        # Changed status
+        assert state.needs_update(generate_finding_output("test-id", "PASSED"))
+        # Changed content
+        assert state.needs_update(
+            generate_finding_output("test-id", "FAILED", "changed")
+        )
+        state.close()
+
+    def test_needs_update_refresh(self):
+        state = Security_Hub_State(STATE_FILE, refresh_days=1)
+        finding_output = generate_finding_output("test-id", "FAILED")
+        state.update(finding_output, "eu-west-1")
+        state.execution_time += 2 * 86400
+        # Unchanged but stale finding
+        assert state.needs_update(finding_output)
+        state.close()
+
+    def test_purge(self):
+        state = Security_Hub_State(STATE_FILE)
+        state.update(generate_finding_output("resolved", "FAILED"), "eu-west-1")
+        state.update(generate_finding_output("present", "FAILED"), "eu-west-1")
+        state.update(generate_finding_output("other-region", "FAILED"), "us-east-1")
+        state.close()
+
+        # Next execution only finds one of them in eu-west-1
+        state = Security_Hub_State(STATE_FILE)
+        state.execution_time += 3600
+        assert not state.needs_update(generate_finding_output("present", "FAILED"))
+        assert state.purge(["eu-west-1"]) == 1
+        assert state.needs_update(generate_finding_output("resolved", "FAILED"))
+        assert not state.needs_update(generate_finding_output("other-region", "FAILED"))
+        state.close()
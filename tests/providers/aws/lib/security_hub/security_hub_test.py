@@ -0,0 +1,98 @@
+from unittest import mock
+
+import boto3
+import botocore
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.security_hub.security_hub import (
+    resolve_security_hub_previous_findings,
+)
+
+AWS_ACCOUNT_ID = "123456789012"
+
+# Mocking Security Hub Get Findings
+make_api_call = botocore.client.BaseClient._make_api_call
+
+archived_findings_ids = []
+
+
+def mock_make_api_call(self, operation_name, kwarg):
+    if operation_name == "DescribeHub":
+        return {
+            "HubArn": "test-hub",
+        }
+    if operation_name == "GetFindings":
+        region = kwarg["Filters"]["Region"][0]["Value"]
+        if "NextToken" not in kwarg:
+            return {
+                "Findings": [
+                    {"Id": f"prowler-current-{region}", "RecordState": "ACTIVE"},
+                    {"Id": f"prowler-old-1-{region}", "RecordState": "ACTIVE"},
+                ],
+                "NextToken": "next",
+            }
+        return {
+            "Findings": [
+                {"Id": f"prowler-old-2-{region}", "RecordState": "ACTIVE"},
+            ],
+        }
+    if operation_name == "BatchImportFindings":
+        for finding in kwarg["Findings"]:
+            assert finding["RecordState"] == "ARCHIVED"
+            archived_findings_ids.append(finding["Id"])
+        return {
+            "FailedCount": 0,
+            "SuccessCount": len(kwarg["Findings"]),
+        }
+    return make_api_call(self, operation_name, kwarg)
+
+
+class Test_SecurityHub:
+    def set_mocked_audit_info(self):
+        return AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=boto3.session.Session(
+                region_name="eu-west-1",
+            ),
+            audited_account=AWS_ACCOUNT_ID,
+            audited_identity_arn="test-arn",
+            audited_user_id="test",
+            audited_partition="aws",
+            profile="default",
+            profile_region="eu-west-1",
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=["eu-west-2", "eu-west-1"],
+            organizations_metadata=None,
+            audit_resources=None,
+        )
+
+    @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_resolve_security_hub_previous_findings(self):
+        archived_findings_ids.clear()
+        security_hub_findings_ids = {
+            "eu-west-1": {"prowler-current-eu-west-1"},
+            "eu-west-2": {"prowler-current-eu-west-2"},
+        }
+        assert (
+            resolve_security_hub_previous_findings(
+                security_hub_findings_ids, self.set_mocked_audit_info()
+            )
+            == 4
+        )
+        assert sorted(archived_findings_ids) == [
+            "prowler-old-1-eu-west-1",
+            "prowler-old-1-eu-west-2",
+            "prowler-old-2-eu-west-1",
+            "prowler-old-2-eu-west-2",
+        ]
+
+    @mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
+    def test_resolve_security_hub_previous_findings_no_findings(self):
+        archived_findings_ids.clear()
+        assert (
+            resolve_security_hub_previous_findings({}, self.set_mocked_audit_info())
+            == 0
+        )
+        assert archived_findings_ids == []
@@ -0,0 +1,147 @@
+from boto3 import client, session
+from moto import mock_sns
+
+from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
+from prowler.providers.aws.lib.service.service import (
+    AWS_Service,
+    Enrichment_Operation,
+    List_Operation,
+    get_checks_attributes,
+)
+from prowler.providers.common.models import Audit_Metadata
+
+AWS_ACCOUNT_NUMBER = "123456789012"
+AWS_REGION = "eu-west-1"
+
+
+class Test_AWS_Service:
+    # Mocked Audit Info
+    def set_mocked_audit_info(self, audit_resources=None):
+        audit_info = AWS_Audit_Info(
+            session_config=None,
+            original_session=None,
+            audit_session=session.Session(
+                profile_name=None,
+                botocore_session=None,
+            ),
+            audited_account=AWS_ACCOUNT_NUMBER,
+            audited_user_id=None,
+            audited_partition="aws",
+            audited_identity_arn=None,
+            profile=None,
+            profile_region=None,
+            credentials=None,
+            assumed_role_info=None,
+            audited_regions=None,
+            organizations_metadata=None,
+            audit_resources=audit_resources,
+        )
+        return audit_info
+
+    def get_regional_clients(self, audit_info):
+        regional_client = audit_info.audit_session.client("sns", region_name=AWS_REGION)
+        regional_client.region = AWS_REGION
+        return {AWS_REGION: regional_client}
+
+    def get_service_class(self):
+        class Test_Service(AWS_Service):
+            list_operations = [
+                List_Operation(
+                    operation="list_topics",
+                    result_key="Topics",
+                    attribute="topics",
+                    arn=lambda topic: topic["TopicArn"],
+                    resource=lambda topic, region: {
+                        "arn": topic["TopicArn"],
+                        "region": region,
+                    },
+                    key=lambda topic: topic["TopicArn"],
+                )
+            ]
+
+        return Test_Service
+
+    @mock_sns
+    def test_collect(self):
+        sns_client = client("sns", region_name=AWS_REGION)
+        topic_arns = [
+            sns_client.create_topic(Name=f"test-topic-{i}")["TopicArn"]
+            for i in range(3)
+        ]
+        audit_info = self.set_mocked_audit_info()
+        service = self.get_service_class()(
+            "sns", audit_info, self.get_regional_clients(audit_info)
+        )
+        assert service.service == "sns"
+        assert service.audited_account == AWS_ACCOUNT_NUMBER
+        assert sorted(service.topics) == sorted(topic_arns)
+        for topic_arn in topic_arns:
+            assert service.topics[topic_arn]["region"] == AWS_REGION
+
+    @mock_sns
+    def test_collect_audit_resources(self):
+        sns_client = client("sns", region_name=AWS_REGION)
+        topic_arn = sns_client.create_topic(Name="test-topic")["TopicArn"]
+        sns_client.create_topic(Name="other-topic")
+        audit_info = self.set_mocked_audit_info(audit_resources=[topic_arn])
+        service = self.get_service_class()(
+            "sns", audit_info, self.get_regional_clients(audit_info)
+        )
+        assert list(service.topics) == [topic_arn]
+
+    @mock_sns
+    def test_enrich(self):
+        class Topic:
+            def __init__(self, arn, region):
+                self.arn = arn
+                self.region = region
+                self.attributes = None
+
+        class Test_Service(AWS_Service):
+            list_operations = [
+                List_Operation(
+                    operation="list_topics",
+                    result_key="Topics",
+                    attribute="topics",
+                    arn=lambda topic: topic["TopicArn"],
+                    resource=lambda topic, region: Topic(topic["TopicArn"], region),
+                )
+            ]
+            enrichment_operations = [
+                Enrichment_Operation(
+                    operation="get_topic_attributes",
+                    attribute="topics",
+                    parameters=lambda topic: {"TopicArn": topic.arn},
+                    enrich=lambda topic, response: setattr(
+                        topic, "attributes", response["Attributes"]
+                    ),
+                )
+            ]
+
+        sns_client = client("sns", region_name=AWS_REGION)
+        topic_arn = sns_client.create_topic(Name="test-topic")["TopicArn"]
+        audit_info = self.set_mocked_audit_info()
+        service = Test_Service("sns", audit_info, self.get_regional_clients(audit_info))
+        assert len(service.topics) == 1
+        assert service.topics[0].attributes["TopicArn"] == topic_arn
+
+    def test_get_checks_attributes(self):
+        checks_attributes = {
+            "test_check_one": ["acl"],
+            "test_check_two": ["acl", "policy"],
+        }
+        audit_info = self.set_mocked_audit_info()
+        # All the attributes if the checks to execute are unknown
+        assert get_checks_attributes(audit_info, checks_attributes) == {
+            "acl",
+            "policy",
+        }
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=["test_check_one", "other_check"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        assert get_checks_attributes(audit_info, checks_attributes) == {"acl"}
+        audit_info.audit_metadata.expected_checks = ["other_check"]
+        assert get_checks_attributes(audit_info, checks_attributes) == set()
@@ -78,8 +78,12 @@ class Test_Lambda_Service:
             audit_resources=None,
             audit_metadata=Audit_Metadata(
                 services_scanned=0,
-                # We need to set this check to call __list_functions__
-                expected_checks=["awslambda_function_no_secrets_in_code"],
+                # We need to set these checks to retrieve the functions code, policy and URL config
+                expected_checks=[
+                    "awslambda_function_no_secrets_in_code",
+                    "awslambda_function_not_publicly_accessible",
+                    "awslambda_function_url_public",
+                ],
                 completed_checks=0,
                 audit_progress=0,
             ),
@@ -0,0 +1,102 @@
+from unittest import mock
+
+from prowler.lib.check.models import Check_Report_AWS
+from prowler.providers.aws.services.cloudwatch.cloudwatch_service import (
+    MetricAlarm,
+    MetricFilter,
+)
+from prowler.providers.aws.services.cloudwatch.lib.metric_filters import (
+    check_cloudwatch_log_metric_filter,
+    get_metric_filters_index,
+)
+
+AWS_REGION = "us-east-1"
+AWS_ACCOUNT_ID = "123456789012"
+pattern = r"\$\.userIdentity\.type\s*=\s*.?Root.?"
+
+trails = [
+    mock.MagicMock(
+        log_group_arn=f"arn:aws:logs:{AWS_REGION}:{AWS_ACCOUNT_ID}:log-group:trail-log-group:*"
+    ),
+    mock.MagicMock(log_group_arn=None),
+]
+metric_filters = [
+    MetricFilter(
+        "other-log-group-filter",
+        "metric-1",
+        '{ $.userIdentity.type = "Root" }',
+        "other-log-group",
+        AWS_REGION,
+    ),
+    MetricFilter(
+        "not-matching-filter",
+        "metric-2",
+        '{ $.eventName = "ConsoleLogin" }',
+        "trail-log-group",
+        AWS_REGION,
+    ),
+    MetricFilter(
+        "root-filter",
+        "metric-3",
+        '{ $.userIdentity.type = "Root" }',
+        "trail-log-group",
+        AWS_REGION,
+    ),
+]
+
+
+def generate_report():
+    report = mock.MagicMock(spec=Check_Report_AWS)
+    report.status = "FAIL"
+    report.status_extended = "No CloudWatch log groups found."
+    report.resource_id = AWS_ACCOUNT_ID
+    report.region = AWS_REGION
+    return report
+
+
+class Test_Metric_Filters:
+    def test_get_metric_filters_index(self):
+        metric_alarms = [
+            MetricAlarm("arn", "alarm", "metric-3", "namespace", AWS_REGION)
+        ]
+        index = get_metric_filters_index(trails, metric_filters, metric_alarms)
+        assert index.trails_metric_filters == metric_filters[1:]
+        assert index.metrics_with_alarms == {"metric-3"}
+        # The index is shared while the services do not change
+        assert get_metric_filters_index(trails, metric_filters, metric_alarms) is index
+        assert get_metric_filters_index(trails, metric_filters, []) is not index
+
+    def test_check_cloudwatch_log_metric_filter_with_alarm(self):
+        metric_alarms = [
+            MetricAlarm("arn", "alarm", "metric-3", "namespace", AWS_REGION)
+        ]
+        report = check_cloudwatch_log_metric_filter(
+            pattern, trails, metric_filters, metric_alarms, generate_report()
+        )
+        assert report.status == "PASS"
+        assert report.resource_id == "trail-log-group"
+        assert (
+            report.status_extended
+            == "CloudWatch log group trail-log-group found with metric filter root-filter and alarms set."
+        )
+
+    def test_check_cloudwatch_log_metric_filter_without_alarm(self):
+        metric_alarms = [
+            MetricAlarm("arn", "alarm", "metric-1", "namespace", AWS_REGION)
+        ]
+        report = check_cloudwatch_log_metric_filter(
+            pattern, trails, metric_filters, metric_alarms, generate_report()
+        )
+        assert report.status == "FAIL"
+        assert (
+            report.status_extended
+            == "CloudWatch log group trail-log-group found with metric filter root-filter but no alarms associated."
+        )
+
+    def test_check_cloudwatch_log_metric_filter_no_metric_filters(self):
+        report = check_cloudwatch_log_metric_filter(
+            pattern, trails, [], [], generate_report()
+        )
+        assert report.status == "FAIL"
+        assert report.status_extended == "No CloudWatch log groups found."
+        assert report.resource_id == AWS_ACCOUNT_ID
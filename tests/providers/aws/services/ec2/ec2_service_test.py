@@ -149,8 +149,6 @@ class Test_EC2_Service:
                         "IpProtocol": "-1",
                         "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
                         "Ipv6Ranges": [],
-                        "PrefixListIds": [],
-                        "UserIdGroupPairs": [],
                     }
                 ]
 
@@ -336,8 +334,6 @@ class Test_EC2_Service:
                         "IpProtocol": "-1",
                         "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
                         "Ipv6Ranges": [],
-                        "PrefixListIds": [],
-                        "UserIdGroupPairs": [],
                     }
                 ]
 
@@ -1,4 +1,10 @@
-from prowler.providers.aws.services.ec2.lib.network_acls import check_network_acl
+from prowler.providers.aws.services.ec2.ec2_service import NetworkACL
+from prowler.providers.aws.services.ec2.lib.network_acls import (
+    check_network_acl,
+    check_network_acl_exposure,
+    compact_network_acl_entries,
+    compile_network_acl,
+)
 
 default_deny_entry_ingress_IPv4 = {
     "CidrBlock": "0.0.0.0/0",
@@ -1186,3 +1192,95 @@ class Test_Network_Acls_IPv4_IPv6:
         )
 
         assert not check_network_acl(entries, tcp_protocol, check_port)
+
+
+class Test_Network_Acls_Compiled:
+    def test_compile_network_acl_first_match_wins(self):
+        entries = [
+            default_deny_entry_ingress_IPv4,
+            {
+                "CidrBlock": "0.0.0.0/0",
+                "Egress": False,
+                "NetworkAclId": "acl-072d520d07e1c1471",
+                "Protocol": "6",
+                "RuleAction": "deny",
+                "RuleNumber": 100,
+                "PortRange": {"From": 22, "To": 22},
+            },
+            {
+                "CidrBlock": "0.0.0.0/0",
+                "Egress": False,
+                "NetworkAclId": "acl-072d520d07e1c1471",
+                "Protocol": "6",
+                "RuleAction": "allow",
+                "RuleNumber": 200,
+                "PortRange": {"From": 0, "To": 1024},
+            },
+            {
+                "CidrBlock": "10.0.0.0/8",
+                "Egress": False,
+                "NetworkAclId": "acl-072d520d07e1c1471",
+                "Protocol": "-1",
+                "RuleAction": "allow",
+                "RuleNumber": 1,
+            },
+        ]
+        compiled_network_acl = compile_network_acl(entries)
+        assert compiled_network_acl.ipv6 == {"-1": ([], [])}
+        assert compiled_network_acl.ipv4["6"] == (
+            [float("-inf"), 0, 22, 23, 1025],
+            ["deny", "allow", "deny", "allow", "deny"],
+        )
+        assert compiled_network_acl.ipv4["-1"] == ([float("-inf")], ["deny"])
+        for port, allowed in [(21, True), (22, False), (23, True), (3389, False)]:
+            assert check_network_acl(entries, "6", port) == allowed
+        # Protocols without entries only match the all traffic entries
+        assert not check_network_acl(entries, "17", 22)
+
+    def test_check_network_acl_exposure_compiles_once(self):
+        network_acl = NetworkACL(
+            "acl-072d520d07e1c1471",
+            "arn",
+            "eu-west-1",
+            [allow_all_entry_ingress_IPv6, default_deny_entry_ingress_IPv4],
+        )
+        assert check_network_acl_exposure(network_acl, "6", 22)
+        compiled_entries = network_acl.compiled_entries
+        assert check_network_acl_exposure(network_acl, "-1", 0)
+        assert network_acl.compiled_entries is compiled_entries
+
+    def test_compact_network_acl_entries(self):
+        entries = [
+            default_deny_entry_ingress_IPv4,
+            {
+                "Egress": False,
+                "Ipv6CidrBlock": "::/0",
+                "NetworkAclId": "acl-072d520d07e1c1471",
+                "PortRange": {"From": 22, "To": 22},
+                "Protocol": "6",
+                "RuleAction": "allow",
+                "RuleNumber": 100,
+            },
+        ]
+        compact_entries = compact_network_acl_entries(entries)
+        assert compact_entries == [
+            {
+                "CidrBlock": "0.0.0.0/0",
+                "Egress": False,
+                "Protocol": "-1",
+                "RuleAction": "deny",
+                "RuleNumber": 32767,
+            },
+            {
+                "Egress": False,
+                "Ipv6CidrBlock": "::/0",
+                "PortRange": {"From": 22, "To": 22},
+                "Protocol": "6",
+                "RuleAction": "allow",
+                "RuleNumber": 100,
+            },
+        ]
+        for port in [22, 3389]:
+            assert check_network_acl(compact_entries, "6", port) == check_network_acl(
+                entries, "6", port
+            )
@@ -1,6 +1,44 @@
 import pytest
 
-from prowler.providers.aws.services.ec2.lib.security_groups import _is_cidr_public
+from prowler.providers.aws.services.ec2.ec2_service import SecurityGroup
+from prowler.providers.aws.services.ec2.lib.security_groups import (
+    _is_cidr_public,
+    check_security_group,
+    check_security_group_exposure,
+    compact_security_group_rules,
+    get_security_group_exposure,
+)
+
+ingress_rules = [
+    {
+        "FromPort": 20,
+        "ToPort": 21,
+        "IpProtocol": "tcp",
+        "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+        "Ipv6Ranges": [],
+    },
+    {
+        "FromPort": 22,
+        "ToPort": 100,
+        "IpProtocol": "tcp",
+        "IpRanges": [{"CidrIp": "8.8.8.0/24"}],
+        "Ipv6Ranges": [],
+    },
+    {
+        "FromPort": 3000,
+        "ToPort": 4000,
+        "IpProtocol": "tcp",
+        "IpRanges": [{"CidrIp": "10.0.0.0/8"}],
+        "Ipv6Ranges": [{"CidrIpv6": "2001:4860::/32"}],
+    },
+    {
+        "FromPort": 5432,
+        "ToPort": 5432,
+        "IpProtocol": "udp",
+        "IpRanges": [],
+        "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+    },
+]
 
 
 class Test_security_groups:
@@ -19,3 +57,97 @@ class Test_security_groups:
 
         assert ex.type == ValueError
         assert ex.match(f"{cidr} has host bits set")
+
+    def test_get_security_group_exposure_merges_port_ranges(self):
+        exposure = get_security_group_exposure(ingress_rules)
+        assert not exposure.all_traffic
+        assert exposure.any_port
+        assert exposure.port_ranges == {
+            "tcp": ([20, 3000], [100, 4000]),
+            "udp": ([5432], [5432]),
+        }
+
+    def test_get_security_group_exposure_all_traffic(self):
+        exposure = get_security_group_exposure(
+            [
+                {
+                    "IpProtocol": "-1",
+                    "IpRanges": [{"CidrIp": "8.8.8.0/24"}],
+                    "Ipv6Ranges": [],
+                }
+            ],
+            any_address=True,
+        )
+        assert not exposure.all_traffic
+        assert not exposure.any_port
+        exposure = get_security_group_exposure(
+            [
+                {
+                    "IpProtocol": "-1",
+                    "IpRanges": [{"CidrIp": "8.8.8.0/24"}],
+                    "Ipv6Ranges": [],
+                }
+            ]
+        )
+        assert exposure.all_traffic
+
+    def test_check_security_group_exposure_matches_check_security_group(self):
+        security_group = SecurityGroup(
+            "test", "arn", "eu-west-1", "sg-test", ingress_rules, []
+        )
+        for protocol in ["tcp", "udp", "-1"]:
+            for ports in [[], [19], [20], [22, 23], [101], [3389], [5432]]:
+                for any_address in [True, False]:
+                    assert check_security_group_exposure(
+                        security_group, protocol, ports, any_address
+                    ) == any(
+                        check_security_group(ingress_rule, protocol, ports, any_address)
+                        for ingress_rule in ingress_rules
+                    )
+        # The exposure is only built once per address matching mode
+        assert list(security_group.exposure.keys()) == [True, False]
+
+    def test_compact_security_group_rules(self):
+        rules = [
+            {
+                "FromPort": 22,
+                "IpProtocol": "tcp",
+                "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "SSH"}],
+                "Ipv6Ranges": [],
+                "PrefixListIds": [],
+                "ToPort": 22,
+                "UserIdGroupPairs": [],
+            },
+            {
+                "IpProtocol": "-1",
+                "IpRanges": [],
+                "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+                "PrefixListIds": [],
+                "UserIdGroupPairs": [{"GroupId": "sg-12345678"}],
+            },
+        ]
+        compact_rules = compact_security_group_rules(rules)
+        assert compact_rules == [
+            {
+                "FromPort": 22,
+                "IpProtocol": "tcp",
+                "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
+                "Ipv6Ranges": [],
+                "ToPort": 22,
+            },
+            {
+                "IpProtocol": "-1",
+                "IpRanges": [],
+                "Ipv6Ranges": [{"CidrIpv6": "::/0"}],
+            },
+        ]
+        for rule, compact_rule in zip(rules, compact_rules):
+            assert check_security_group(rule, "tcp", [22]) == check_security_group(
+                compact_rule, "tcp", [22]
+            )
+
+    def test_security_group_slots(self):
+        security_group = SecurityGroup("sg", "arn", "eu-west-1", "sg-1", [], [])
+        assert not hasattr(security_group, "__dict__")
+        with pytest.raises(AttributeError):
+            security_group.unknown = True
@@ -1,11 +1,16 @@
 from json import dumps
+from unittest import mock
 
 from boto3 import client, session
 from freezegun import freeze_time
 from moto import mock_iam
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
-from prowler.providers.aws.services.iam.iam_service import IAM, is_service_role
+from prowler.providers.aws.services.iam.iam_service import (
+    IAM,
+    is_service_role,
+    start_credential_report_generation,
+)
 
 AWS_ACCOUNT_NUMBER = 123456789012
 TEST_DATETIME = "2023-01-01T12:01:01+00:00"
@@ -51,6 +56,21 @@ class Test_IAM_Service:
         iam = IAM(audit_info)
         assert iam.session.__class__.__name__ == "Session"
 
+    # Test IAM Credential Report early generation
+    @mock_iam
+    def test_start_credential_report_generation(self):
+        iam_client = client("iam")
+        iam_client.create_user(UserName="user1")
+        audit_info = self.set_mocked_audit_info()
+        start_credential_report_generation(audit_info)
+        # The report is already completed, so there is no need to wait for it
+        with mock.patch(
+            "prowler.providers.aws.services.iam.iam_service.time.sleep"
+        ) as sleep:
+            iam = IAM(audit_info)
+            assert len(iam.credential_report) == 1
+            sleep.assert_not_called()
+
     # Test IAM Get Credential Report
     @freeze_time(TEST_DATETIME)
     @mock_iam
@@ -5,6 +5,7 @@ from moto import mock_s3, mock_s3control
 
 from prowler.providers.aws.lib.audit_info.models import AWS_Audit_Info
 from prowler.providers.aws.services.s3.s3_service import S3, S3Control
+from prowler.providers.common.models import Audit_Metadata
 
 AWS_ACCOUNT_NUMBER = "123456789012"
 AWS_REGION = "us-east-1"
@@ -278,6 +279,37 @@ class Test_S3_Service:
         )
         assert s3.buckets[0].encryption == "aws:kms"
 
+    # Test S3 only collecting the attributes read by the checks to execute
+    @mock_s3
+    def test__get_checks_attributes__(self):
+        # Generate S3 Client
+        s3_client = client("s3")
+        # Create S3 Bucket
+        bucket_name = "test-bucket"
+        s3_client.create_bucket(
+            Bucket=bucket_name, ObjectOwnership="BucketOwnerEnforced"
+        )
+        s3_client.put_bucket_encryption(
+            Bucket=bucket_name,
+            ServerSideEncryptionConfiguration={
+                "Rules": [
+                    {"ApplyServerSideEncryptionByDefault": {"SSEAlgorithm": "AES256"}}
+                ]
+            },
+        )
+        # S3 client for this test class
+        audit_info = self.set_mocked_audit_info()
+        audit_info.audit_metadata = Audit_Metadata(
+            services_scanned=0,
+            expected_checks=["s3_bucket_default_encryption"],
+            completed_checks=0,
+            audit_progress=0,
+        )
+        s3 = S3(audit_info)
+        assert len(s3.buckets) == 1
+        assert s3.buckets[0].encryption == "AES256"
+        assert s3.buckets[0].ownership is None
+
     # Test S3 Get Bucket Ownership Controls
     @mock_s3
     def test__get_bucket_ownership_controls__(self):
@@ -171,6 +171,10 @@ class Test_Set_Audit_Info:
     @patch.object(
         Audit_Info, "print_audit_credentials", new=mock_print_audit_credentials
     )
+    @patch(
+        "prowler.providers.common.audit_info.get_enabled_regions",
+        new=lambda audit_info: {"eu-west-1"},
+    )
     def test_set_audit_info_aws(self):
         provider = "aws"
         arguments = {
@@ -189,6 +193,8 @@ class Test_Set_Audit_Info:
 
         audit_info = set_provider_audit_info(provider, arguments)
         assert isinstance(audit_info, AWS_Audit_Info)
+        assert audit_info.enabled_regions == {"eu-west-1"}
+        audit_info.enabled_regions = None
 
     @patch(
         "prowler.providers.common.audit_info.azure_audit_info",